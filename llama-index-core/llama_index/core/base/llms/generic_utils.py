@@ -303,8 +303,10 @@ def get_from_param_or_env(
     """Get a value from a param or an environment variable."""
     if param is not None:
         return param
-    elif env_key and env_key in os.environ and os.environ[env_key]:
-        return os.environ[env_key]
+
+    env_value = os.environ.get(env_key) if env_key else None
+    if env_value:
+        return env_value
     elif default is not None:
         return default
     else:
@@ -36,6 +36,7 @@ class SimpleChatEngine(BaseChatEngine):
         self._llm = llm
         self._memory = memory
         self._prefix_messages = prefix_messages
+        self._prefix_token_count: Optional[int] = None
         self.callback_manager = callback_manager or CallbackManager([])
 
     @classmethod
@@ -77,6 +78,20 @@ class SimpleChatEngine(BaseChatEngine):
             ),
         )
 
+    def _get_prefix_token_count(self) -> int:
+        """Get the token count of the prefix messages.
+
+        The prefix messages are fixed for the lifetime of the engine, so the
+        count is computed once instead of re-tokenizing them on every turn.
+        """
+        if self._prefix_token_count is None:
+            self._prefix_token_count = len(
+                self._memory.tokenizer_fn(
+                    " ".join([(m.content or "") for m in self._prefix_messages])
+                )
+            )
+        return self._prefix_token_count
+
     @trace_method("chat")
     def chat(
         self, message: str, chat_history: Optional[List[ChatMessage]] = None
@@ -84,13 +99,8 @@ class SimpleChatEngine(BaseChatEngine):
         if chat_history is not None:
             self._memory.set(chat_history)
         self._memory.put(ChatMessage(content=message, role="user"))
-        initial_token_count = len(
-            self._memory.tokenizer_fn(
-                " ".join([(m.content or "") for m in self._prefix_messages])
-            )
-        )
         all_messages = self._prefix_messages + self._memory.get(
-            initial_token_count=initial_token_count
+            initial_token_count=self._get_prefix_token_count()
         )
 
         chat_response = self._llm.chat(all_messages)
@@ -106,13 +116,8 @@ class SimpleChatEngine(BaseChatEngine):
         if chat_history is not None:
             self._memory.set(chat_history)
         self._memory.put(ChatMessage(content=message, role="user"))
-        initial_token_count = len(
-            self._memory.tokenizer_fn(
-                " ".join([(m.content or "") for m in self._prefix_messages])
-            )
-        )
         all_messages = self._prefix_messages + self._memory.get(
-            initial_token_count=initial_token_count
+            initial_token_count=self._get_prefix_token_count()
         )
 
         chat_response = StreamingAgentChatResponse(
@@ -132,13 +137,8 @@ class SimpleChatEngine(BaseChatEngine):
         if chat_history is not None:
             self._memory.set(chat_history)
         self._memory.put(ChatMessage(content=message, role="user"))
-        initial_token_count = len(
-            self._memory.tokenizer_fn(
-                " ".join([(m.content or "") for m in self._prefix_messages])
-            )
-        )
         all_messages = self._prefix_messages + self._memory.get(
-            initial_token_count=initial_token_count
+            initial_token_count=self._get_prefix_token_count()
         )
 
         chat_response = await self._llm.achat(all_messages)
@@ -154,13 +154,8 @@ class SimpleChatEngine(BaseChatEngine):
         if chat_history is not None:
             self._memory.set(chat_history)
         self._memory.put(ChatMessage(content=message, role="user"))
-        initial_token_count = len(
-            self._memory.tokenizer_fn(
-                " ".join([(m.content or "") for m in self._prefix_messages])
-            )
-        )
         all_messages = self._prefix_messages + self._memory.get(
-            initial_token_count=initial_token_count
+            initial_token_count=self._get_prefix_token_count()
         )
 
         chat_response = StreamingAgentChatResponse(
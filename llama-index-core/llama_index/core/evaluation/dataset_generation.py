@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import os
 import re
 import uuid
 from typing import Coroutine, Dict, List, Optional, Tuple
 
 from deprecated import deprecated
-from llama_index.core import Document, ServiceContext, SummaryIndex
+from llama_index.core import Document, ServiceContext
+from llama_index.core.async_utils import DEFAULT_NUM_WORKERS, run_jobs
 from llama_index.core.bridge.pydantic import BaseModel, Field
 from llama_index.core.callbacks.base import CallbackManager
 from llama_index.core.ingestion import run_transformations
@@ -34,6 +37,9 @@ from llama_index.core.settings import (
     transformations_from_settings_or_context,
 )
 
+# strips list numbering such as "1)", "2." or "3 " from generated questions
+_QUESTION_NUMBER_PREFIX_RE = re.compile(r"^\d+[\).\s]+")
+
 DEFAULT_QUESTION_GENERATION_PROMPT = """\
 Context information is below.
 ---------------------
@@ -127,6 +133,10 @@ class DatasetGenerator(PromptMixin):
         generated per chunk. Each document is chunked of size 512 words.
         text_question_template: Question generation template.
         question_gen_query: Question generation query.
+        workers: Maximum number of concurrent LLM calls.
+        cache_dir: Directory to cache generated questions in. When set, \
+        questions for a node are only generated once per model, prompt and \
+        node content, and reused on later runs.
 
     """
 
@@ -141,6 +151,8 @@ class DatasetGenerator(PromptMixin):
         question_gen_query: str | None = None,
         metadata_mode: MetadataMode = MetadataMode.NONE,
         show_progress: bool = False,
+        workers: int = DEFAULT_NUM_WORKERS,
+        cache_dir: str | None = None,
         # deprecated
         service_context: ServiceContext | None = None,
     ) -> None:
@@ -165,6 +177,8 @@ class DatasetGenerator(PromptMixin):
         self.nodes = nodes
         self._metadata_mode = metadata_mode
         self._show_progress = show_progress
+        self._workers = workers
+        self._cache_dir = cache_dir
 
     @classmethod
     def from_documents(
@@ -180,6 +194,8 @@ class DatasetGenerator(PromptMixin):
         required_keywords: List[str] | None = None,
         exclude_keywords: List[str] | None = None,
         show_progress: bool = False,
+        workers: int = DEFAULT_NUM_WORKERS,
+        cache_dir: str | None = None,
         # deprecated
         service_context: ServiceContext | None = None,
     ) -> DatasetGenerator:
@@ -197,17 +213,17 @@ class DatasetGenerator(PromptMixin):
             documents, transformations, show_progress=show_progress
         )
 
-        # use node postprocessor to filter nodes
-        required_keywords = required_keywords or []
-        exclude_keywords = exclude_keywords or []
-        node_postprocessor = KeywordNodePostprocessor(
-            callback_manager=callback_manager,
-            required_keywords=required_keywords,
-            exclude_keywords=exclude_keywords,
-        )
-        node_with_scores = [NodeWithScore(node=node) for node in nodes]
-        node_with_scores = node_postprocessor.postprocess_nodes(node_with_scores)
-        nodes = [node_with_score.node for node_with_score in node_with_scores]
+        # use node postprocessor to filter nodes, only wrapping the nodes
+        # when there are keywords to filter on
+        if required_keywords or exclude_keywords:
+            node_postprocessor = KeywordNodePostprocessor(
+                callback_manager=callback_manager,
+                required_keywords=required_keywords or [],
+                exclude_keywords=exclude_keywords or [],
+            )
+            node_with_scores = [NodeWithScore(node=node) for node in nodes]
+            node_with_scores = node_postprocessor.postprocess_nodes(node_with_scores)
+            nodes = [node_with_score.node for node_with_score in node_with_scores]
 
         return cls(
             nodes=nodes,
@@ -218,9 +234,46 @@ class DatasetGenerator(PromptMixin):
             text_qa_template=text_qa_template,
             question_gen_query=question_gen_query,
             show_progress=show_progress,
+            workers=workers,
+            cache_dir=cache_dir,
             service_context=service_context,
         )
 
+    def _get_question_cache_path(self, context_str: str) -> str:
+        """Get the cache file path for the questions generated from a context."""
+        assert self._cache_dir is not None
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (
+            self.llm.metadata.model_name,
+            self.text_question_template.get_template(),
+            self.question_gen_query,
+            context_str,
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return os.path.join(self._cache_dir, f"{hasher.hexdigest()}.json")
+
+    async def _agenerate_questions(self, context_str: str) -> str:
+        """Generate questions for a context, reusing cached output if any."""
+        cache_path = None
+        if self._cache_dir is not None:
+            cache_path = self._get_question_cache_path(context_str)
+            if os.path.exists(cache_path):
+                with open(cache_path) as f:
+                    return json.load(f)["response"]
+
+        response = await self.llm.apredict(
+            self.text_question_template,
+            context_str=context_str,
+            query_str=self.question_gen_query,
+        )
+
+        if cache_path is not None:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump({"response": response}, f)
+        return response
+
     async def _agenerate_dataset(
         self,
         nodes: List[BaseNode],
@@ -232,43 +285,26 @@ class DatasetGenerator(PromptMixin):
         queries: Dict[str, str] = {}
         responses_dict: Dict[str, str] = {}
 
-        if self._show_progress:
-            from tqdm.asyncio import tqdm_asyncio
-
-            async_module = tqdm_asyncio
-        else:
-            async_module = asyncio
-
-        summary_indices: List[SummaryIndex] = []
+        # each node is its own context, so prompt the LLM directly instead of
+        # building a single-document index and query engine per node
+        context_strs: List[str] = []
         for node in nodes:
             if num is not None and len(query_tasks) >= num:
                 break
-            index = SummaryIndex.from_documents(
-                [
-                    Document(
-                        text=node.get_content(metadata_mode=self._metadata_mode),
-                        metadata=node.metadata,
-                    )
-                ],
-                callback_manager=self.callback_manager,
-            )
-
-            query_engine = index.as_query_engine(
-                llm=self.llm,
-                text_qa_template=self.text_question_template,
-                use_async=True,
-            )
-            task = query_engine.aquery(
-                self.question_gen_query,
-            )
+            context_str = Document(
+                text=node.get_content(metadata_mode=self._metadata_mode),
+                metadata=node.metadata,
+            ).get_content(metadata_mode=MetadataMode.LLM)
+            task = self._agenerate_questions(context_str)
             query_tasks.append(task)
-            summary_indices.append(index)
+            context_strs.append(context_str)
 
-        responses = await async_module.gather(*query_tasks)
+        responses = await run_jobs(query_tasks, self._show_progress, self._workers)
         for idx, response in enumerate(responses):
             result = str(response).strip().split("\n")
             cleaned_questions = [
-                re.sub(r"^\d+[\).\s]", "", question).strip() for question in result
+                _QUESTION_NUMBER_PREFIX_RE.sub("", question).strip()
+                for question in result
             ]
             cleaned_questions = [
                 question for question in cleaned_questions if len(question) > 0
@@ -279,18 +315,20 @@ class DatasetGenerator(PromptMixin):
             queries.update(cur_queries)
 
             if generate_response:
-                index = summary_indices[idx]
+                context_str = context_strs[idx]
                 qr_tasks = []
                 cur_query_items = list(cur_queries.items())
                 cur_query_keys = [query_id for query_id, _ in cur_query_items]
                 for query_id, query in cur_query_items:
-                    qa_query_engine = index.as_query_engine(
-                        llm=self.llm,
-                        text_qa_template=self.text_qa_template,
+                    qr_task = self.llm.apredict(
+                        self.text_qa_template,
+                        context_str=context_str,
+                        query_str=query,
                     )
-                    qr_task = qa_query_engine.aquery(query)
                     qr_tasks.append(qr_task)
-                qr_responses = await async_module.gather(*qr_tasks)
+                qr_responses = await run_jobs(
+                    qr_tasks, self._show_progress, self._workers
+                )
                 for query_id, qa_response in zip(cur_query_keys, qr_responses):
                     responses_dict[query_id] = str(qa_response)
             else:
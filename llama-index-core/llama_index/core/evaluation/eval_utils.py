@@ -7,7 +7,7 @@ NOTE: These are beta functions, might change.
 import asyncio
 import subprocess
 import tempfile
-from collections import defaultdict
+import warnings
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
@@ -16,7 +16,7 @@ import pandas as pd
 from llama_index_client import ProjectCreate
 from llama_index_client.types.eval_question_create import EvalQuestionCreate
 
-from llama_index.core.async_utils import asyncio_module
+from llama_index.core.async_utils import run_jobs
 from llama_index.core.base.base_query_engine import BaseQueryEngine
 from llama_index.core.constants import DEFAULT_PROJECT_NAME
 from llama_index.core.evaluation.base import EvaluationResult
@@ -25,16 +25,26 @@ from llama_index.core.ingestion.api_utils import get_client
 if TYPE_CHECKING:
     from llama_index.core.llama_dataset import LabelledRagDataset
 
+# default number of queries `aget_responses` keeps in flight at once
+DEFAULT_MAX_IN_FLIGHT_QUERIES = 32
+
 
 async def aget_responses(
-    questions: List[str], query_engine: BaseQueryEngine, show_progress: bool = False
+    questions: List[str],
+    query_engine: BaseQueryEngine,
+    show_progress: bool = False,
+    workers: int = DEFAULT_MAX_IN_FLIGHT_QUERIES,
 ) -> List[str]:
-    """Get responses."""
+    """Get responses.
+
+    At most `workers` queries are in flight at once; responses are returned
+    in the same order as `questions`.
+
+    """
     tasks = []
     for question in questions:
         tasks.append(query_engine.aquery(question))
-    asyncio_mod = asyncio_module(show_progress=show_progress)
-    return await asyncio_mod.gather(*tasks)
+    return await run_jobs(tasks, show_progress=show_progress, workers=workers)
 
 
 def get_responses(
@@ -63,12 +73,32 @@ def get_results_df(
             List of metric keys to get.
 
     """
-    metric_dict = defaultdict(list)
-    metric_dict["names"] = names
-    for metric_key in metric_keys:
-        for eval_results in eval_results_list:
-            mean_score = np.array([r.score for r in eval_results[metric_key]]).mean()
-            metric_dict[metric_key].append(mean_score)
+    # gather all scores into one NaN-padded (metrics, runs, results) array so
+    # the means are computed in a single reduction
+    max_num_results = max(
+        (
+            len(eval_results[metric_key])
+            for eval_results in eval_results_list
+            for metric_key in metric_keys
+        ),
+        default=0,
+    )
+    scores = np.full(
+        (len(metric_keys), len(eval_results_list), max_num_results), np.nan
+    )
+    for i, metric_key in enumerate(metric_keys):
+        for j, eval_results in enumerate(eval_results_list):
+            metric_results = eval_results[metric_key]
+            scores[i, j, : len(metric_results)] = [r.score for r in metric_results]
+
+    with warnings.catch_warnings():
+        # runs without any results for a metric yield NaN, as before
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean_scores = np.nanmean(scores, axis=2)
+
+    metric_dict: Dict[str, Any] = {"names": names}
+    for i, metric_key in enumerate(metric_keys):
+        metric_dict[metric_key] = mean_scores[i]
     return pd.DataFrame(metric_dict)
 
 
@@ -5,8 +5,11 @@ Build a KG by extracting triplets, and leveraging the KG during query-time.
 """
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import re
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from llama_index.core.async_utils import run_async_tasks, run_jobs
 from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.core.constants import GRAPH_STORE_KEY
@@ -32,6 +35,10 @@ from llama_index.core.utils import get_tqdm_iterable
 
 logger = logging.getLogger(__name__)
 
+# text between the first "(" and the first ")" of a line, for lines where the
+# first ")" does not come before the first "("
+_TRIPLET_PART_RE = re.compile(r"^[^()\n]*\(([^)\n]*)\)", re.MULTILINE)
+
 
 class KnowledgeGraphIndex(BaseIndex[KG]):
     """Knowledge Graph Index.
@@ -52,6 +59,9 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
             Defaults to 128.
         kg_triplet_extract_fn (Optional[Callable]): The function to use for
             extracting triplets. Defaults to None.
+        use_async (bool): Whether to extract triplets from nodes concurrently
+            with asynchronous LLM calls when building the index.
+            Defaults to False.
 
     """
 
@@ -71,6 +81,7 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
         show_progress: bool = False,
         max_object_length: int = 128,
         kg_triplet_extract_fn: Optional[Callable] = None,
+        use_async: bool = False,
         # deprecated
         service_context: Optional[ServiceContext] = None,
         **kwargs: Any,
@@ -90,6 +101,7 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
         )
         self._max_object_length = max_object_length
         self._kg_triplet_extract_fn = kg_triplet_extract_fn
+        self._use_async = use_async
 
         self._llm = llm or llm_from_settings_or_context(Settings, service_context)
         self._embed_model = embed_model or embed_model_from_settings_or_context(
@@ -158,24 +170,43 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
             response, max_length=self._max_object_length
         )
 
+    async def _aextract_triplets(self, text: str) -> List[Tuple[str, str, str]]:
+        if self._kg_triplet_extract_fn is not None:
+            return self._kg_triplet_extract_fn(text)
+        else:
+            return await self._allm_extract_triplets(text)
+
+    async def _allm_extract_triplets(self, text: str) -> List[Tuple[str, str, str]]:
+        """Extract keywords from text."""
+        response = await self._llm.apredict(
+            self.kg_triple_extract_template,
+            text=text,
+        )
+        return self._parse_triplet_response(
+            response, max_length=self._max_object_length
+        )
+
     @staticmethod
     def _parse_triplet_response(
         response: str, max_length: int = 128
     ) -> List[Tuple[str, str, str]]:
-        knowledge_strs = response.strip().split("\n")
         results = []
-        for text in knowledge_strs:
-            if "(" not in text or ")" not in text or text.index(")") < text.index("("):
-                # skip empty lines and non-triplets
-                continue
-            triplet_part = text[text.index("(") + 1 : text.index(")")]
+        # lines without a "(...)" part (e.g. empty lines) and non-triplets are
+        # skipped by the regex
+        for triplet_part in _TRIPLET_PART_RE.findall(response):
             tokens = triplet_part.split(",")
             if len(tokens) != 3:
                 continue
 
-            if any(len(s.encode("utf-8")) > max_length for s in tokens):
+            if any(
+                len(s) > max_length
+                or (not s.isascii() and len(s.encode("utf-8")) > max_length)
+                for s in tokens
+            ):
                 # We count byte-length instead of len() for UTF-8 chars,
                 # will skip if any of the tokens are too long.
+                # Byte-length is never smaller than len() and equals it for
+                # ASCII, so only non-ASCII tokens need to be encoded.
                 # This is normally due to a poorly formatted triplet
                 # extraction, in more serious KG building cases
                 # we'll need NLP models to better extract triplets.
@@ -198,48 +229,72 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
         """Build the index from nodes."""
         # do simple concatenation
         index_struct = self.index_struct_cls()
-        nodes_with_progress = get_tqdm_iterable(
-            nodes, self._show_progress, "Processing nodes"
-        )
-        for n in nodes_with_progress:
-            triplets = self._extract_triplets(
-                n.get_content(metadata_mode=MetadataMode.LLM)
+        nodes_triplets: Iterable[List[Tuple[str, str, str]]]
+        if self._use_async:
+            # extract triplets concurrently, then update the graph serially
+            jobs = [
+                self._aextract_triplets(n.get_content(metadata_mode=MetadataMode.LLM))
+                for n in nodes
+            ]
+            nodes_triplets = run_async_tasks(
+                [run_jobs(jobs, self._show_progress, desc="Extracting triplets")]
+            )[0]
+        else:
+            nodes_with_progress = get_tqdm_iterable(
+                nodes, self._show_progress, "Processing nodes"
+            )
+            nodes_triplets = (
+                self._extract_triplets(n.get_content(metadata_mode=MetadataMode.LLM))
+                for n in nodes_with_progress
             )
-            logger.debug(f"> Extracted triplets: {triplets}")
+
+        # collect unique triplet texts across all nodes so they can be embedded
+        # in batches after extraction, rather than once per node
+        triplet_texts: Dict[str, None] = {}
+        for n, triplets in zip(nodes, nodes_triplets):
+            logger.debug("> Extracted triplets: %s", triplets)
             for triplet in triplets:
                 subj, _, obj = triplet
                 self.upsert_triplet(triplet)
                 index_struct.add_node([subj, obj], n)
+                if self.include_embeddings:
+                    triplet_texts[str(triplet)] = None
 
-            if self.include_embeddings:
-                triplet_texts = [str(t) for t in triplets]
-
-                embed_outputs = self._embed_model.get_text_embedding_batch(
-                    triplet_texts, show_progress=self._show_progress
-                )
-                for rel_text, rel_embed in zip(triplet_texts, embed_outputs):
-                    index_struct.add_to_embedding_dict(rel_text, rel_embed)
+        if triplet_texts:
+            rel_texts = list(triplet_texts)
+            embed_outputs = self._embed_model.get_text_embedding_batch(
+                rel_texts, show_progress=self._show_progress
+            )
+            for rel_text, rel_embed in zip(rel_texts, embed_outputs):
+                index_struct.add_to_embedding_dict(rel_text, rel_embed)
 
         return index_struct
 
     def _insert(self, nodes: Sequence[BaseNode], **insert_kwargs: Any) -> None:
         """Insert a document."""
+        # triplet texts without an embedding yet, embedded in one batch below
+        missing_triplet_texts: Dict[str, None] = {}
         for n in nodes:
             triplets = self._extract_triplets(
                 n.get_content(metadata_mode=MetadataMode.LLM)
             )
-            logger.debug(f"Extracted triplets: {triplets}")
+            logger.debug("Extracted triplets: %s", triplets)
             for triplet in triplets:
                 subj, _, obj = triplet
-                triplet_str = str(triplet)
                 self.upsert_triplet(triplet)
                 self._index_struct.add_node([subj, obj], n)
-                if (
-                    self.include_embeddings
-                    and triplet_str not in self._index_struct.embedding_dict
-                ):
-                    rel_embedding = self._embed_model.get_text_embedding(triplet_str)
-                    self._index_struct.add_to_embedding_dict(triplet_str, rel_embedding)
+                if self.include_embeddings:
+                    triplet_str = str(triplet)
+                    if triplet_str not in self._index_struct.embedding_dict:
+                        missing_triplet_texts[triplet_str] = None
+
+        if missing_triplet_texts:
+            rel_texts = list(missing_triplet_texts)
+            rel_embeddings = self._embed_model.get_text_embedding_batch(
+                rel_texts, show_progress=self._show_progress
+            )
+            for rel_text, rel_embedding in zip(rel_texts, rel_embeddings):
+                self._index_struct.add_to_embedding_dict(rel_text, rel_embedding)
 
         # Update the storage context's index_store
         self._storage_context.index_store.add_index_struct(self._index_struct)
@@ -310,21 +365,22 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
     @property
     def ref_doc_info(self) -> Dict[str, RefDocInfo]:
         """Retrieve a dict mapping of ingested documents and their nodes+metadata."""
-        node_doc_ids_sets = list(self._index_struct.table.values())
-        node_doc_ids = list(set().union(*node_doc_ids_sets))
+        node_doc_ids = list(set().union(*self._index_struct.table.values()))
         nodes = self.docstore.get_nodes(node_doc_ids)
 
-        all_ref_doc_info = {}
-        for node in nodes:
-            ref_node = node.source_node
-            if not ref_node:
-                continue
+        # many nodes usually share a source document, so only look up each
+        # ref doc once
+        ref_doc_ids = {
+            node.source_node.node_id: None for node in nodes if node.source_node
+        }
 
-            ref_doc_info = self.docstore.get_ref_doc_info(ref_node.node_id)
+        all_ref_doc_info = {}
+        for ref_doc_id in ref_doc_ids:
+            ref_doc_info = self.docstore.get_ref_doc_info(ref_doc_id)
             if not ref_doc_info:
                 continue
 
-            all_ref_doc_info[ref_node.node_id] = ref_doc_info
+            all_ref_doc_info[ref_doc_id] = ref_doc_info
         return all_ref_doc_info
 
     def get_networkx_graph(self, limit: int = 100) -> Any:
@@ -345,12 +401,15 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
             )
 
         g = nx.Graph()
-        subjs = list(self.index_struct.table.keys())
+        # only `limit` starting nodes are used, avoid passing every key in large KGs
+        subjs = list(islice(self.index_struct.table.keys(), limit))
 
         # add edges
         rel_map = self._graph_store.get_rel_map(subjs=subjs, depth=1, limit=limit)
 
-        added_nodes = set()
+        # collect edges first and add them in bulk, networkx adds the
+        # endpoint nodes automatically
+        edges = []
         for keyword in rel_map:
             for path in rel_map[keyword]:
                 subj = keyword
@@ -358,15 +417,12 @@ class KnowledgeGraphIndex(BaseIndex[KG]):
                     if i + 2 >= len(path):
                         break
 
-                    if subj not in added_nodes:
-                        g.add_node(subj)
-                        added_nodes.add(subj)
-
                     rel = path[i + 1]
                     obj = path[i + 2]
 
-                    g.add_edge(subj, obj, label=rel, title=rel)
+                    edges.append((subj, obj, {"label": rel, "title": rel}))
                     subj = obj
+        g.add_edges_from(edges)
         return g
 
     @property
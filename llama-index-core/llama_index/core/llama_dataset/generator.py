@@ -36,6 +36,8 @@ from llama_index.core.settings import (
     transformations_from_settings_or_context,
 )
 
+_QUESTION_NUMBER_PREFIX_RE = re.compile(r"^\d+[\).\s]+")
+
 DEFAULT_QUESTION_GENERATION_PROMPT = """\
 Context information is below.
 ---------------------
@@ -181,7 +183,8 @@ class RagDatasetGenerator(PromptMixin):
         for idx, response in enumerate(responses):
             result = str(response).strip().split("\n")
             cleaned_questions = [
-                re.sub(r"^\d+[\).\s]", "", question).strip() for question in result
+                _QUESTION_NUMBER_PREFIX_RE.sub("", question).strip()
+                for question in result
             ]
             cleaned_questions = [
                 question for question in cleaned_questions if len(question) > 0
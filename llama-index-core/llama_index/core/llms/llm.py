@@ -1,4 +1,4 @@
-from collections import ChainMap
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -7,6 +7,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     Union,
     get_args,
     runtime_checkable,
@@ -31,6 +32,7 @@ from llama_index.core.base.query_pipeline.query import (
 from llama_index.core.bridge.pydantic import (
     BaseModel,
     Field,
+    PrivateAttr,
     root_validator,
     validator,
 )
@@ -94,48 +96,86 @@ def stream_completion_response_to_tokens(
     completion_response_gen: CompletionResponseGen,
 ) -> TokenGen:
     """Convert a stream completion response to a stream of tokens."""
-
-    def gen() -> TokenGen:
-        for response in completion_response_gen:
-            yield response.delta or ""
-
-    return gen()
+    return (response.delta or "" for response in completion_response_gen)
 
 
 def stream_chat_response_to_tokens(
     chat_response_gen: ChatResponseGen,
 ) -> TokenGen:
     """Convert a stream completion response to a stream of tokens."""
+    return (response.delta or "" for response in chat_response_gen)
 
-    def gen() -> TokenGen:
-        for response in chat_response_gen:
-            yield response.delta or ""
-
-    return gen()
 
-
-async def astream_completion_response_to_tokens(
-    completion_response_gen: CompletionResponseAsyncGen,
+async def _astream_response_to_tokens(
+    response_gen: Union[CompletionResponseAsyncGen, ChatResponseAsyncGen],
+    batch_chars: int = 0,
 ) -> TokenAsyncGen:
-    """Convert a stream completion response to a stream of tokens."""
-
-    async def gen() -> TokenAsyncGen:
-        async for response in completion_response_gen:
+    if batch_chars <= 0:
+        async for response in response_gen:
             yield response.delta or ""
+        return
+
+    buffer: List[str] = []
+    buffered_chars = 0
+    async for response in response_gen:
+        if not response.delta:
+            continue
+        buffer.append(response.delta)
+        buffered_chars += len(response.delta)
+        if buffered_chars >= batch_chars:
+            yield "".join(buffer)
+            buffer = []
+            buffered_chars = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def astream_completion_response_to_tokens(
+    completion_response_gen: CompletionResponseAsyncGen,
+    batch_chars: int = 0,
+) -> TokenAsyncGen:
+    """Convert a stream completion response to a stream of tokens.
 
-    return gen()
+    If `batch_chars` is set, consecutive deltas are coalesced and yielded once
+    at least that many characters are buffered.
+    """
+    return _astream_response_to_tokens(completion_response_gen, batch_chars)
 
 
-async def astream_chat_response_to_tokens(
+def astream_chat_response_to_tokens(
     chat_response_gen: ChatResponseAsyncGen,
+    batch_chars: int = 0,
 ) -> TokenAsyncGen:
-    """Convert a stream completion response to a stream of tokens."""
+    """Convert a stream chat response to a stream of tokens.
 
-    async def gen() -> TokenAsyncGen:
-        async for response in chat_response_gen:
-            yield response.delta or ""
+    If `batch_chars` is set, consecutive deltas are coalesced and yielded once
+    at least that many characters are buffered.
+    """
+    return _astream_response_to_tokens(chat_response_gen, batch_chars)
+
+
+@lru_cache(maxsize=128)
+def _split_query_wrapper_template(template: str) -> Optional[Tuple[str, str]]:
+    """Split a template whose only placeholder is `{query_str}` around it."""
+    prefix, sep, suffix = template.partition("{query_str}")
+    if not sep or any(c in prefix or c in suffix for c in "{}"):
+        return None
+    return prefix, suffix
 
-    return gen()
+
+def _format_query_wrapper(prompt: BasePromptTemplate, query_str: str) -> str:
+    """Format a query wrapper prompt, skipping `format` for plain templates."""
+    if (
+        type(prompt) is PromptTemplate
+        and not prompt.kwargs
+        and not prompt.function_mappings
+        and not prompt.template_var_mappings
+        and prompt.output_parser is None
+    ):
+        parts = _split_query_wrapper_template(prompt.template)
+        if parts is not None:
+            return parts[0] + query_str + parts[1]
+    return prompt.format(query_str=query_str)
 
 
 def default_completion_to_prompt(prompt: str) -> str:
@@ -186,6 +226,8 @@ class LLM(BaseLLM):
         exclude=True,
     )
 
+    _system_message: Optional[ChatMessage] = PrivateAttr(default=None)
+
     # -- Pydantic Configs --
 
     @validator("messages_to_prompt", pre=True)
@@ -213,10 +255,14 @@ class LLM(BaseLLM):
     def _log_template_data(
         self, prompt: BasePromptTemplate, **prompt_args: Any
     ) -> None:
+        if not self.callback_manager.handlers:
+            # nobody is listening for the templating event
+            return
+
+        # prompt kwargs take precedence over the call-time args
+        all_kwargs = {**prompt_args, **prompt.kwargs} if prompt_args else prompt.kwargs
         template_vars = {
-            k: v
-            for k, v in ChainMap(prompt.kwargs, prompt_args).items()
-            if k in prompt.template_vars
+            k: all_kwargs[k] for k in prompt.template_vars if k in all_kwargs
         }
         with self.callback_manager.event(
             CBEventType.TEMPLATING,
@@ -262,11 +308,11 @@ class LLM(BaseLLM):
         extended_prompt = formatted_prompt
 
         if self.system_prompt:
-            extended_prompt = self.system_prompt + "\n\n" + extended_prompt
+            extended_prompt = f"{self.system_prompt}\n\n{extended_prompt}"
 
         if self.query_wrapper_prompt:
-            extended_prompt = self.query_wrapper_prompt.format(
-                query_str=extended_prompt
+            extended_prompt = _format_query_wrapper(
+                self.query_wrapper_prompt, extended_prompt
             )
 
         return extended_prompt
@@ -274,10 +320,15 @@ class LLM(BaseLLM):
     def _extend_messages(self, messages: List[ChatMessage]) -> List[ChatMessage]:
         """Add system prompt to chat message list."""
         if self.system_prompt:
-            messages = [
-                ChatMessage(role=MessageRole.SYSTEM, content=self.system_prompt),
-                *messages,
-            ]
+            # system_prompt may be reassigned, so rebuild the message when it changes
+            if (
+                self._system_message is None
+                or self._system_message.content != self.system_prompt
+            ):
+                self._system_message = ChatMessage(
+                    role=MessageRole.SYSTEM, content=self.system_prompt
+                )
+            messages = [self._system_message, *messages]
         return messages
 
     def _as_query_component(self, **kwargs: Any) -> QueryComponent:
@@ -463,6 +514,9 @@ class LLM(BaseLLM):
                 print(token, end="", flush=True)
             ```
         """
+        if prompt.output_parser is not None or self.output_parser is not None:
+            raise NotImplementedError("Output parser is not supported for streaming.")
+
         self._log_template_data(prompt, **prompt_args)
 
         if self.metadata.is_chat_model:
@@ -474,9 +528,6 @@ class LLM(BaseLLM):
             stream_response = self.stream_complete(formatted_prompt, formatted=True)
             stream_tokens = stream_completion_response_to_tokens(stream_response)
 
-        if prompt.output_parser is not None or self.output_parser is not None:
-            raise NotImplementedError("Output parser is not supported for streaming.")
-
         return stream_tokens
 
     @dispatcher.span
@@ -539,6 +590,12 @@ class LLM(BaseLLM):
         Yields:
             str: An async generator that yields strings of tokens.
 
+        Note:
+            Every token resumes the consuming coroutine, so the event loop
+            implementation shows up in per-token latency. Applications streaming
+            at high throughput can run under `uvloop` (e.g. `uvloop.run(main())`
+            or `uvicorn --loop uvloop`); the loop policy is left to the caller.
+
         Examples:
             ```python
             from llama_index.core.prompts import PromptTemplate
@@ -549,21 +606,21 @@ class LLM(BaseLLM):
                 print(token, end="", flush=True)
             ```
         """
+        if prompt.output_parser is not None or self.output_parser is not None:
+            raise NotImplementedError("Output parser is not supported for streaming.")
+
         self._log_template_data(prompt, **prompt_args)
 
         if self.metadata.is_chat_model:
             messages = self._get_messages(prompt, **prompt_args)
             chat_response = await self.astream_chat(messages)
-            stream_tokens = await astream_chat_response_to_tokens(chat_response)
+            stream_tokens = astream_chat_response_to_tokens(chat_response)
         else:
             formatted_prompt = self._get_prompt(prompt, **prompt_args)
             stream_response = await self.astream_complete(
                 formatted_prompt, formatted=True
             )
-            stream_tokens = await astream_completion_response_to_tokens(stream_response)
-
-        if prompt.output_parser is not None or self.output_parser is not None:
-            raise NotImplementedError("Output parser is not supported for streaming.")
+            stream_tokens = astream_completion_response_to_tokens(stream_response)
 
         return stream_tokens
 
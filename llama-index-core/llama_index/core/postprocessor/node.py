@@ -34,6 +34,9 @@ class KeywordNodePostprocessor(BaseNodePostprocessor):
         query_bundle: Optional[QueryBundle] = None,
     ) -> List[NodeWithScore]:
         """Postprocess nodes."""
+        if not self.required_keywords and not self.exclude_keywords:
+            return nodes
+
         try:
             import spacy
         except ImportError:
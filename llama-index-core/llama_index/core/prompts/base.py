@@ -101,6 +101,10 @@ class BasePromptTemplate(ChainableMixin, BaseModel, ABC):
         and then (2) call the template_var_mappings.
 
         """
+        if not self.function_mappings and not self.template_var_mappings:
+            # nothing to map, skip rebuilding the kwargs dict
+            return kwargs
+
         # map function
         new_kwargs = self._map_function_vars(kwargs)
         # map template vars (to point to existing format vars in string template)
@@ -1,19 +1,24 @@
+from functools import lru_cache
 from string import Formatter
-from typing import List
+from typing import List, Tuple
 
 from llama_index.core.base.llms.base import BaseLLM
 
 
-def get_template_vars(template_str: str) -> List[str]:
-    """Get template variables from a template string."""
-    variables = []
+@lru_cache(maxsize=1024)
+def _parse_template_vars(template_str: str) -> Tuple[str, ...]:
+    """Parse template variables from a template string (cached)."""
     formatter = Formatter()
+    return tuple(
+        variable_name
+        for _, variable_name, _, _ in formatter.parse(template_str)
+        if variable_name
+    )
 
-    for _, variable_name, _, _ in formatter.parse(template_str):
-        if variable_name:
-            variables.append(variable_name)
 
-    return variables
+def get_template_vars(template_str: str) -> List[str]:
+    """Get template variables from a template string."""
+    return list(_parse_template_vars(template_str))
 
 
 def is_chat_model(llm: BaseLLM) -> bool:
@@ -598,9 +598,11 @@ class QueryPipeline(QueryComponent):
 
         nodes_to_keep = set()
         nodes_to_remove = set()
+        # computed once, the leaf keys are checked for every kept/removed node below
+        leaf_keys = self._get_leaf_keys()
 
         # if there's no more edges, clear queue
-        if module_key in self._get_leaf_keys():
+        if module_key in leaf_keys:
             new_queue = []
         else:
             edge_list = list(self.dag.edges(module_key, data=True))
@@ -636,7 +638,7 @@ class QueryPipeline(QueryComponent):
         # be sure to not remove any remaining dependencies of the current path
         available_paths = []
         for node in nodes_to_keep:
-            for leaf_node in self._get_leaf_keys():
+            for leaf_node in leaf_keys:
                 if leaf_node == node:
                     available_paths.append([node])
                 else:
@@ -653,7 +655,7 @@ class QueryPipeline(QueryComponent):
 
         removal_paths = []
         for node in nodes_to_remove:
-            for leaf_node in self._get_leaf_keys():
+            for leaf_node in leaf_keys:
                 if leaf_node == node:
                     removal_paths.append([node])
                 else:
@@ -303,12 +303,12 @@ class LLMPredictor(BaseLLMPredictor):
             messages = prompt.format_messages(llm=self._llm, **prompt_args)
             messages = self._extend_messages(messages)
             chat_response = await self._llm.astream_chat(messages)
-            stream_tokens = await astream_chat_response_to_tokens(chat_response)
+            stream_tokens = astream_chat_response_to_tokens(chat_response)
         else:
             formatted_prompt = prompt.format(llm=self._llm, **prompt_args)
             formatted_prompt = self._extend_prompt(formatted_prompt)
             stream_response = await self._llm.astream_complete(formatted_prompt)
-            stream_tokens = await astream_completion_response_to_tokens(stream_response)
+            stream_tokens = astream_completion_response_to_tokens(stream_response)
         return stream_tokens
 
     def _extend_prompt(
@@ -346,7 +346,7 @@ def add_sync_version(func: Any) -> Any:
 
     @wraps(func)
     def _wrapper(*args: Any, **kwds: Any) -> Any:
-        return asyncio.get_event_loop().run_until_complete(func(*args, **kwds))
+        return asyncio.run(func(*args, **kwds))
 
     func.sync = _wrapper
     return func
@@ -1,5 +1,8 @@
 """Test dataset generation."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 from llama_index.core.evaluation.dataset_generation import DatasetGenerator
 from llama_index.core.prompts.base import PromptTemplate
 from llama_index.core.prompts.prompt_type import PromptType
@@ -42,3 +45,30 @@ generate only questions based on the below query.
     assert qr_pairs[0][1] == "gen_question:hello_world:hello_world"
     assert qr_pairs[1][0] == "gen_question:foo_bar"
     assert qr_pairs[1][1] == "gen_question:foo_bar:foo_bar"
+
+
+def test_dataset_generation_cache(
+    tmp_path: Path,
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test that generated questions are cached on disk."""
+    test_nodes = [TextNode(text="hello_world"), TextNode(text="foo_bar")]
+
+    dataset_generator = DatasetGenerator(
+        test_nodes,
+        service_context=mock_service_context,
+        text_question_template=PromptTemplate(
+            "{context_str}\n{query_str}", prompt_type=PromptType.QUESTION_ANSWER
+        ),
+        question_gen_query="gen_question",
+        cache_dir=str(tmp_path),
+    )
+    questions = dataset_generator.generate_questions_from_nodes()
+    assert questions == ["gen_question:hello_world", "gen_question:foo_bar"]
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # the second run is served from the cache, without calling the LLM
+    with patch.object(
+        type(dataset_generator.llm), "apredict", side_effect=AssertionError
+    ):
+        assert dataset_generator.generate_questions_from_nodes() == questions
@@ -0,0 +1,60 @@
+"""Test eval utils."""
+
+import asyncio
+
+from llama_index.core.evaluation.base import EvaluationResult
+from llama_index.core.evaluation.eval_utils import get_responses, get_results_df
+
+
+class _CountingQueryEngine:
+    """Answers with the question, tracking how many queries run at once."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aquery(self, question: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return question
+
+
+def test_get_responses() -> None:
+    questions = [f"question {i}" for i in range(10)]
+    query_engine = _CountingQueryEngine()
+
+    responses = get_responses(questions, query_engine, workers=3)
+
+    assert responses == questions
+    assert query_engine.max_in_flight == 3
+
+
+def test_get_results_df() -> None:
+    eval_results_list = [
+        {
+            "correctness": [
+                EvaluationResult(score=1.0),
+                EvaluationResult(score=3.0),
+            ],
+            "faithfulness": [EvaluationResult(score=1.0)],
+        },
+        {
+            "correctness": [EvaluationResult(score=4.0)],
+            "faithfulness": [
+                EvaluationResult(score=0.0),
+                EvaluationResult(score=1.0),
+                EvaluationResult(score=0.5),
+            ],
+        },
+    ]
+    results_df = get_results_df(
+        eval_results_list,  # type: ignore[arg-type]
+        names=["base", "new"],
+        metric_keys=["correctness", "faithfulness"],
+    )
+
+    assert list(results_df["names"]) == ["base", "new"]
+    assert list(results_df["correctness"]) == [2.0, 4.0]
+    assert list(results_df["faithfulness"]) == [1.0, 0.5]
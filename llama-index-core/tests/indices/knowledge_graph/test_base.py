@@ -219,6 +219,31 @@ def test_build_kg(
         assert len(ref_doc_info.node_ids) == 3
 
 
+def test_build_kg_async(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test build knowledge graph with concurrent triplet extraction."""
+    index = KnowledgeGraphIndex.from_documents(
+        documents,
+        service_context=mock_service_context,
+        kg_triplet_extract_fn=mock_extract_triplets,
+        use_async=True,
+    )
+    # NOTE: in these unit tests, document text == triplets
+    nodes = index.docstore.get_nodes(list(index.index_struct.node_ids))
+    table_chunks = {n.get_content() for n in nodes}
+    assert len(table_chunks) == 3
+    assert index.index_struct.table.keys() == {
+        "foo",
+        "bar",
+        "hello",
+        "world",
+        "Jane",
+        "Bob",
+    }
+
+
 def test__parse_triplet_response(
     doc_triplets_with_text_around: List[Document],
     mock_service_context: ServiceContext,
@@ -235,3 +260,18 @@ def test__parse_triplet_response(
     assert ("Foo", "Is", "Bar") in parsed_triplets[0]
     assert ("Hello", "Is not", "World") in parsed_triplets[0]
     assert ("Jane", "Is mother of", "Bob") in parsed_triplets[0]
+
+
+def test__parse_triplet_response_max_length() -> None:
+    """Test that tokens are length-checked in UTF-8 bytes."""
+    response = "(foo, is, bar)\n(café, is, bar)\n(foo, is, barbaz)"
+    # "café" is 4 characters but 5 bytes in UTF-8
+    parsed_triplets = KnowledgeGraphIndex._parse_triplet_response(
+        response, max_length=5
+    )
+    assert parsed_triplets == [("Foo", "Is", "Bar"), ("Café", "Is", "Bar")]
+
+    parsed_triplets = KnowledgeGraphIndex._parse_triplet_response(
+        response, max_length=4
+    )
+    assert parsed_triplets == [("Foo", "Is", "Bar")]
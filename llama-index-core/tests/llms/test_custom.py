@@ -7,6 +7,7 @@ from llama_index.core.base.llms.types import (
     LLMMetadata,
 )
 from llama_index.core.llms.custom import CustomLLM
+from llama_index.core.prompts import PromptTemplate
 
 
 class TestLLM(CustomLLM):
@@ -66,3 +67,14 @@ def test_streaming() -> None:
 
     llm.stream_complete(prompt)
     llm.stream_chat([message])
+
+
+def test_query_wrapper_prompt() -> None:
+    llm = TestLLM()
+
+    llm.query_wrapper_prompt = PromptTemplate("[INST] {query_str} [/INST]")
+    assert llm._extend_prompt("test prompt") == "[INST] test prompt [/INST]"
+
+    # templates with escaped braces go through the regular formatting
+    llm.query_wrapper_prompt = PromptTemplate("{{json}} {query_str}")
+    assert llm._extend_prompt("test prompt") == "{json} test prompt"
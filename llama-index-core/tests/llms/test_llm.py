@@ -0,0 +1,30 @@
+import asyncio
+from typing import List
+
+from llama_index.core.base.llms.types import (
+    CompletionResponse,
+    CompletionResponseAsyncGen,
+)
+from llama_index.core.llms.llm import astream_completion_response_to_tokens
+
+
+async def _astream(deltas: List[str]) -> CompletionResponseAsyncGen:
+    text = ""
+    for delta in deltas:
+        text += delta
+        yield CompletionResponse(text=text, delta=delta)
+
+
+async def _collect(batch_chars: int) -> List[str]:
+    deltas = ["a", "bc", "", "d", "efgh", "i"]
+    return [
+        token
+        async for token in astream_completion_response_to_tokens(
+            _astream(deltas), batch_chars=batch_chars
+        )
+    ]
+
+
+def test_astream_completion_response_to_tokens() -> None:
+    assert asyncio.run(_collect(0)) == ["a", "bc", "", "d", "efgh", "i"]
+    assert asyncio.run(_collect(3)) == ["abc", "defgh", "i"]
@@ -333,6 +333,20 @@ def test_keyword_postprocessor() -> None:
     assert len(new_nodes) == 3
 
 
+def test_keyword_postprocessor_no_keywords() -> None:
+    """Test keyword processor is a no-op without keywords."""
+    nodes = [
+        TextNode(text="Hello world.", id_="1"),
+        TextNode(text="This is a test.", id_="2"),
+    ]
+    node_with_scores = [NodeWithScore(node=node) for node in nodes]
+
+    # does not require spacy when there is nothing to match
+    postprocessor = KeywordNodePostprocessor()
+    new_nodes = postprocessor.postprocess_nodes(node_with_scores)
+    assert new_nodes == node_with_scores
+
+
 @pytest.mark.skipif(not spacy_installed, reason="spacy not installed")
 def test_keyword_postprocessor_for_non_english() -> None:
     """Test keyword processor for non English."""
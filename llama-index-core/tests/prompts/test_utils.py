@@ -5,3 +5,11 @@ def test_get_template_vars() -> None:
     template = "hello {text} {foo}"
     template_vars = get_template_vars(template)
     assert template_vars == ["text", "foo"]
+
+
+def test_get_template_vars_cached_copy() -> None:
+    template = "hello {text} {foo}"
+    template_vars = get_template_vars(template)
+    template_vars.append("bar")
+    # mutating a returned list must not leak into the cache
+    assert get_template_vars(template) == ["text", "foo"]
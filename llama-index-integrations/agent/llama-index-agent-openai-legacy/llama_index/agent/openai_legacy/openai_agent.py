@@ -212,7 +212,9 @@ class BaseOpenAIAgent(BaseAgent):
     def _process_message(self, chat_response: ChatResponse) -> AgentChatResponse:
         ai_message = chat_response.message
         self.memory.put(ai_message)
-        return AgentChatResponse(response=str(ai_message.content), sources=self.sources)
+        content = ai_message.content
+        response = content if isinstance(content, str) else str(content)
+        return AgentChatResponse(response=response, sources=self.sources)
 
     def _get_stream_ai_response(
         self, **llm_chat_kwargs: Any
@@ -273,7 +275,10 @@ class BaseOpenAIAgent(BaseAgent):
             function_message, tool_output = call_function(
                 tools, tool_call, verbose=self._verbose
             )
-            event.on_end(payload={EventPayload.FUNCTION_OUTPUT: str(tool_output)})
+            # reuse the already stringified output from the function message
+            event.on_end(
+                payload={EventPayload.FUNCTION_OUTPUT: function_message.content}
+            )
         self.sources.append(tool_output)
         self.memory.put(function_message)
 
@@ -298,7 +303,10 @@ class BaseOpenAIAgent(BaseAgent):
             function_message, tool_output = await acall_function(
                 tools, tool_call, verbose=self._verbose
             )
-            event.on_end(payload={EventPayload.FUNCTION_OUTPUT: str(tool_output)})
+            # reuse the already stringified output from the function message
+            event.on_end(
+                payload={EventPayload.FUNCTION_OUTPUT: function_message.content}
+            )
         self.sources.append(tool_output)
         self.memory.put(function_message)
 
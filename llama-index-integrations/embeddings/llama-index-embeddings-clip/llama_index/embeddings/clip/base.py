@@ -1,5 +1,6 @@
 import logging
-from typing import Any, List
+import threading
+from typing import Any, Dict, List, Tuple
 
 from llama_index.core.base.embeddings.base import Embedding
 from llama_index.core.bridge.pydantic import Field, PrivateAttr
@@ -25,6 +26,11 @@ AVAILABLE_CLIP_MODELS = (
 )
 DEFAULT_CLIP_MODEL = "ViT-B/32"
 
+# Loaded (model, preprocess) pairs keyed by (model_name, device), shared by all
+# ClipEmbedding instances so the weights are only loaded once per process.
+_CLIP_MODEL_CACHE: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+_CLIP_MODEL_CACHE_LOCK = threading.Lock()
+
 
 class ClipEmbedding(MultiModalEmbedding):
     """CLIP embedding models for encoding text and image for Multi-Modal purpose.
@@ -92,9 +98,13 @@ class ClipEmbedding(MultiModalEmbedding):
                 raise ValueError(
                     f"Model name {self.model_name} is not available in CLIP."
                 )
-            self._model, self._preprocess = clip.load(
-                self.model_name, device=self._device
-            )
+            cache_key = (self.model_name, self._device)
+            with _CLIP_MODEL_CACHE_LOCK:
+                if cache_key not in _CLIP_MODEL_CACHE:
+                    model, preprocess = clip.load(self.model_name, device=self._device)
+                    model.eval()
+                    _CLIP_MODEL_CACHE[cache_key] = (model, preprocess)
+                self._model, self._preprocess = _CLIP_MODEL_CACHE[cache_key]
 
         except Exception as e:
             logger.error("Error while loading clip model.")
@@ -106,23 +116,33 @@ class ClipEmbedding(MultiModalEmbedding):
         return self._get_query_embedding(query)
 
     def _get_text_embedding(self, text: str) -> Embedding:
-        return self._get_text_embeddings([text])[0]
-
-    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
-        results = []
-        for text in texts:
-            try:
-                import clip
-            except ImportError:
-                raise ImportError(
-                    "ClipEmbedding requires `pip install git+https://github.com/openai/CLIP.git` and torch."
-                )
+        try:
+            import clip
+            import torch
+        except ImportError:
+            raise ImportError(
+                "ClipEmbedding requires `pip install git+https://github.com/openai/CLIP.git` and torch."
+            )
+        with torch.inference_mode():
             text_embedding = self._model.encode_text(
                 clip.tokenize(text).to(self._device)
             )
-            results.append(text_embedding.tolist()[0])
+            return text_embedding.tolist()[0]
 
-        return results
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        try:
+            import clip
+            import torch
+        except ImportError:
+            raise ImportError(
+                "ClipEmbedding requires `pip install git+https://github.com/openai/CLIP.git` and torch."
+            )
+        # tokenize and encode the whole batch in a single forward pass
+        with torch.inference_mode():
+            text_embeddings = self._model.encode_text(
+                clip.tokenize(texts).to(self._device)
+            )
+            return text_embeddings.tolist()
 
     def _get_query_embedding(self, query: str) -> Embedding:
         return self._get_text_embedding(query)
@@ -135,7 +155,7 @@ class ClipEmbedding(MultiModalEmbedding):
     def _get_image_embedding(self, img_file_path: ImageType) -> Embedding:
         import torch
 
-        with torch.no_grad():
+        with torch.inference_mode():
             image = (
                 self._preprocess(Image.open(img_file_path))
                 .unsqueeze(0)
@@ -36,7 +36,8 @@ class ColbertIndex(BaseIndex[IndexDict]):
     nbits: number of bits to quantize the residual vectors. Default: 2.
     kmeans_niters: number of kmeans clustering iterations. Default: 1.
     gpus: number of GPUs to use for indexing. Default: 0.
-    rank: number of ranks to use for indexing. Default: 1.
+    ranks: number of ranks to use for indexing.
+        Default: one rank per GPU (`gpus`), or 1 when running on CPU.
     doc_maxlen: max document length. Default: 120.
     query_maxlen: max query length. Default: 60.
     kmeans_niters: number of kmeans iterations. Default: 4.
@@ -54,7 +55,7 @@ class ColbertIndex(BaseIndex[IndexDict]):
         show_progress: bool = False,
         nbits: int = 2,
         gpus: int = 0,
-        ranks: int = 1,
+        ranks: Optional[int] = None,
         doc_maxlen: int = 120,
         query_maxlen: int = 60,
         kmeans_niters: int = 4,
@@ -67,7 +68,7 @@ class ColbertIndex(BaseIndex[IndexDict]):
         self.index_name = index_name
         self.nbits = nbits
         self.gpus = gpus
-        self.ranks = ranks
+        self.ranks = ranks if ranks else max(1, gpus)
         self.doc_maxlen = doc_maxlen
         self.query_maxlen = query_maxlen
         self.kmeans_niters = kmeans_niters
@@ -183,12 +184,10 @@ class ColbertIndex(BaseIndex[IndexDict]):
         """
         doc_ids, _, scores = self.store.search(text=query_str, k=top_k)
 
-        node_doc_ids = [self._docs_pos_to_node_id[id] for id in doc_ids]
+        docs_pos_to_node_id = self._docs_pos_to_node_id
+        node_doc_ids = [docs_pos_to_node_id[doc_id] for doc_id in doc_ids]
         nodes = self.docstore.get_nodes(node_doc_ids)
 
-        nodes_with_score = []
-
-        for node, score in zip(nodes, scores):
-            nodes_with_score.append(NodeWithScore(node=node, score=score))
-
-        return nodes_with_score
+        return [
+            NodeWithScore(node=node, score=score) for node, score in zip(nodes, scores)
+        ]
@@ -1,8 +1,10 @@
-from typing import Any, Callable, Dict, Optional, Sequence
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import httpx
 from llama_index.core.base.llms.types import ChatMessage
-from llama_index.core.bridge.pydantic import Field, PrivateAttr, root_validator
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
 from llama_index.core.callbacks import CallbackManager
 from llama_index.core.base.llms.generic_utils import get_from_param_or_env
 from llama_index.core.types import BaseOutputParser, PydanticProgramMode
@@ -15,6 +17,33 @@ from openai import AsyncAzureOpenAI
 from openai import AzureOpenAI as SyncAzureOpenAI
 from openai.lib.azure import AzureADTokenProvider
 
+# connection pool shared by the sync clients of all AzureOpenAI instances that
+# were not given a custom `http_client`, so that keep-alive connections are
+# reused instead of every client opening its own pool
+_shared_http_client: Optional[httpx.Client] = None
+_shared_http_client_lock = threading.Lock()
+
+
+def _get_shared_http_client() -> httpx.Client:
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None:
+            # mirror the openai client's defaults; timeouts are set per request
+            _shared_http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=1000, max_keepalive_connections=100
+                ),
+                follow_redirects=True,
+            )
+        return _shared_http_client
+
+
+# instances `AzureOpenAI.get_or_create` copies from, dropped once no copy is left
+_instance_registry: "weakref.WeakValueDictionary[Tuple[Any, ...], AzureOpenAI]" = (
+    weakref.WeakValueDictionary()
+)
+_instance_registry_lock = threading.Lock()
+
 
 class AzureOpenAI(OpenAI):
     """
@@ -77,6 +106,9 @@ class AzureOpenAI(OpenAI):
     _azure_ad_token: Any = PrivateAttr(default=None)
     _client: SyncAzureOpenAI = PrivateAttr()
     _aclient: AsyncAzureOpenAI = PrivateAttr()
+    # the registered instance a `get_or_create` copy was made from, kept alive
+    # by its copies
+    _registered: Optional["AzureOpenAI"] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -145,30 +177,51 @@ class AzureOpenAI(OpenAI):
             output_parser=output_parser,
             **kwargs,
         )
+        # validated once here rather than in a root validator, which would re-run
+        # on every field assignment (the model uses validate_assignment)
+        self._validate_env()
 
-    @root_validator(pre=True)
-    def validate_env(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_env(self) -> None:
         """Validate necessary credentials are set."""
-        if (
-            values["api_base"] == "https://api.openai.com/v1"
-            and values["azure_endpoint"] is None
-        ):
+        if self.api_base == "https://api.openai.com/v1" and self.azure_endpoint is None:
             raise ValueError(
                 "You must set OPENAI_API_BASE to your Azure endpoint. "
                 "It should look like https://YOUR_RESOURCE_NAME.openai.azure.com/"
             )
-        if values["api_version"] is None:
+        if self.api_version is None:
             raise ValueError("You must set OPENAI_API_VERSION for Azure OpenAI.")
 
-        return values
+    @classmethod
+    def get_or_create(cls, **kwargs: Any) -> "AzureOpenAI":
+        """
+        Return a copy of an existing instance built with the same arguments.
+
+        Useful when an LLM is constructed per request or per workflow step: the
+        arguments are only validated once for as long as a copy is referenced
+        somewhere. Every call returns its own shallow copy, so callers may set
+        attributes (e.g. `system_prompt` or `callback_manager`) without affecting
+        each other; the copies only share the underlying HTTP client.
+        """
+        key = (cls, *sorted((k, repr(v)) for k, v in kwargs.items()))
+        with _instance_registry_lock:
+            registered = _instance_registry.get(key)
+            if registered is None:
+                registered = cls(**kwargs)
+                _instance_registry[key] = registered
+        instance = registered.copy()
+        instance._registered = registered
+        return instance
 
     def _get_client(self) -> SyncAzureOpenAI:
+        http_client = self._http_client or _get_shared_http_client()
         if not self.reuse_client:
-            return SyncAzureOpenAI(**self._get_credential_kwargs())
+            return SyncAzureOpenAI(
+                **self._get_credential_kwargs(http_client=http_client)
+            )
 
         if self._client is None:
             self._client = SyncAzureOpenAI(
-                **self._get_credential_kwargs(),
+                **self._get_credential_kwargs(http_client=http_client),
             )
         return self._client
 
@@ -182,10 +235,17 @@ class AzureOpenAI(OpenAI):
             )
         return self._aclient
 
+    def _is_azure_client(self) -> bool:
+        # avoid building a sync client just to check its type (e.g. in async streams)
+        return True
+
     def _get_credential_kwargs(self, **kwargs: Any) -> Dict[str, Any]:
         if self.use_azure_ad:
-            self._azure_ad_token = refresh_openai_azuread_token(self._azure_ad_token)
-            self.api_key = self._azure_ad_token.token
+            azure_ad_token = refresh_openai_azuread_token(self._azure_ad_token)
+            # only reassign (and re-validate) the api key when a new token was issued
+            if azure_ad_token is not self._azure_ad_token:
+                self._azure_ad_token = azure_ad_token
+                self.api_key = azure_ad_token.token
 
         return {
             "api_key": self.api_key,
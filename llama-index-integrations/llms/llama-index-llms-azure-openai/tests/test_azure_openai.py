@@ -46,3 +46,17 @@ def test_custom_http_client(sync_azure_openai_mock: MagicMock) -> None:
     kwargs = sync_azure_openai_mock.call_args.kwargs
     assert "http_client" in kwargs
     assert kwargs["http_client"] == custom_http_client
+
+
+def test_get_or_create() -> None:
+    azure_openai = AzureOpenAI.get_or_create(engine="foo bar")
+    other = AzureOpenAI.get_or_create(engine="foo bar")
+    assert other is not azure_openai
+    assert other._registered is azure_openai._registered
+    assert AzureOpenAI.get_or_create(engine="foo baz")._registered is not (
+        azure_openai._registered
+    )
+
+    # every caller gets its own copy to configure
+    azure_openai.system_prompt = "You are a pirate."
+    assert other.system_prompt is None
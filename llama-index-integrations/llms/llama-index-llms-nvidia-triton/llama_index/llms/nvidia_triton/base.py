@@ -24,12 +24,16 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 import random
+import time
 from typing import (
     Any,
+    AsyncGenerator,
     Dict,
     Optional,
     Sequence,
+    Tuple,
 )
 
 from llama_index.core.bridge.pydantic import Field, PrivateAttr
@@ -46,10 +50,20 @@ from llama_index.core.base.llms.types import (
 )
 from llama_index.core.llms.callbacks import llm_chat_callback
 from llama_index.core.base.llms.generic_utils import (
-    completion_to_chat_decorator,
+    astream_completion_response_to_chat_response,
+    completion_response_to_chat_response,
+    stream_completion_response_to_chat_response,
+)
+from llama_index.core.base.llms.generic_utils import (
+    messages_to_prompt as generic_messages_to_prompt,
 )
 from llama_index.core.llms.llm import LLM
-from llama_index.llms.nvidia_triton.utils import GrpcTritonClient
+from llama_index.llms.nvidia_triton.utils import (
+    AioGrpcTritonClient,
+    GrpcTritonClient,
+    new_request_id,
+)
+from tritonclient.utils import InferenceServerException
 
 DEFAULT_SERVER_URL = "localhost:8001"
 DEFAULT_MAX_RETRIES = 3
@@ -64,6 +78,11 @@ DEFAULT_REPTITION_PENALTY = 1.0
 DEFAULT_LENGTH_PENALTY = 1.0
 DEFAULT_REUSE_CLIENT = False
 DEFAULT_TRITON_LOAD_MODEL = False
+DEFAULT_STREAM_INTERVAL_MS = 20
+# only transient server conditions are retried, anything else fails fast
+RETRYABLE_STATUSES = ("StatusCode.UNAVAILABLE", "StatusCode.RESOURCE_EXHAUSTED")
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
 
 
 class NvidiaTriton(LLM):
@@ -140,8 +159,16 @@ class NvidiaTriton(LLM):
         default=DEFAULT_TRITON_LOAD_MODEL,
         description="True if a Triton load model API call should be made before using the client",
     )
+    stream_interval_ms: int = Field(
+        default=DEFAULT_STREAM_INTERVAL_MS,
+        description="Window (milliseconds) within which streamed tokens are "
+        "combined into a single response",
+    )
 
     _client: Optional[GrpcTritonClient] = PrivateAttr()
+    _aclient: Optional[
+        Tuple[asyncio.AbstractEventLoop, AioGrpcTritonClient]
+    ] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -158,6 +185,7 @@ class NvidiaTriton(LLM):
         timeout: float = DEFAULT_TIMEOUT,
         reuse_client: bool = DEFAULT_REUSE_CLIENT,
         triton_load_model_call: bool = DEFAULT_TRITON_LOAD_MODEL,
+        stream_interval_ms: int = DEFAULT_STREAM_INTERVAL_MS,
         callback_manager: Optional[CallbackManager] = None,
         additional_kwargs: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
@@ -178,6 +206,7 @@ class NvidiaTriton(LLM):
             timeout=timeout,
             reuse_client=reuse_client,
             triton_load_model_call=triton_load_model_call,
+            stream_interval_ms=stream_interval_ms,
             callback_manager=callback_manager,
             additional_kwargs=additional_kwargs,
             **kwargs,
@@ -224,6 +253,18 @@ class NvidiaTriton(LLM):
             self._client = GrpcTritonClient(self.server_url)
         return self._client
 
+    def _get_aclient(self) -> AioGrpcTritonClient:
+        """Create or reuse an asyncio Triton client connection."""
+        if not self.reuse_client:
+            return AioGrpcTritonClient(self.server_url)
+
+        # a grpc.aio channel is bound to the event loop it was created on, so a
+        # call from another loop (e.g. a later `asyncio.run`) gets a new client
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient[0] is not loop:
+            self._aclient = (loop, AioGrpcTritonClient(self.server_url))
+        return self._aclient[1]
+
     @property
     def metadata(self) -> LLMMetadata:
         """Gather and return metadata about the user Triton configured LLM model."""
@@ -233,66 +274,177 @@ class NvidiaTriton(LLM):
 
     @llm_chat_callback()
     def chat(self, messages: Sequence[ChatMessage], **kwargs: Any) -> ChatResponse:
-        chat_fn = completion_to_chat_decorator(self.complete)
-        return chat_fn(messages, **kwargs)
+        # same as completion_to_chat_decorator, without building a wrapper per call
+        completion_response = self.complete(
+            generic_messages_to_prompt(messages), **kwargs
+        )
+        return completion_response_to_chat_response(completion_response)
 
+    @llm_chat_callback()
     def stream_chat(
         self, messages: Sequence[ChatMessage], **kwargs: Any
     ) -> ChatResponseGen:
-        raise NotImplementedError
+        completion_response_gen = self.stream_complete(
+            generic_messages_to_prompt(messages), **kwargs
+        )
+        return stream_completion_response_to_chat_response(completion_response_gen)
+
+    def _complete_once(
+        self,
+        client: GrpcTritonClient,
+        model_name: str,
+        request_id: str,
+        invocation_params: Dict[str, Any],
+    ) -> str:
+        result_queue = client.request_streaming(
+            model_name, request_id, **invocation_params
+        )
+        tokens = []
+        for token in result_queue:
+            if isinstance(token, InferenceServerException):
+                client.stop_stream(model_name, request_id)
+                raise token
+            tokens.append(token)
+        return "".join(tokens)
 
     def complete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
     ) -> CompletionResponse:
-        from tritonclient.utils import InferenceServerException
-
         client = self._get_client()
 
-        invocation_params = self._get_model_default_parameters
-        invocation_params.update(kwargs)
-        invocation_params["prompt"] = [[prompt]]
-        model_params = self._identifying_params
-        model_params.update(kwargs)
-        request_id = str(random.randint(1, 9999999))  # nosec
+        invocation_params = {
+            **self._get_model_default_parameters,
+            **kwargs,
+            "prompt": [[prompt]],
+        }
+        model_name = kwargs.get("model_name", self.model_name)
 
         if self.triton_load_model_call:
-            client.load_model(model_params["model_name"])
-
-        result_queue = client.request_streaming(
-            model_params["model_name"], request_id, **invocation_params
-        )
-        response = ""
-        for token in result_queue:
-            if isinstance(token, InferenceServerException):
-                client.stop_stream(model_params["model_name"], request_id)
-                raise token
-            response = response + token
+            client.load_model(model_name)
+
+        attempts = max(self.max_retries or 0, 1)
+        delay = RETRY_BACKOFF_BASE
+        for attempt in range(attempts):
+            # a fresh request id per attempt, so a retry is never mistaken for
+            # a continuation of the failed request
+            request_id = new_request_id()
+            try:
+                text = self._complete_once(
+                    client, model_name, request_id, invocation_params
+                )
+                break
+            except InferenceServerException as err:
+                if err.status() not in RETRYABLE_STATUSES or attempt == attempts - 1:
+                    raise
+                time.sleep(delay * (1 + random.random() * 0.5))  # nosec
+                delay = min(delay * 2, RETRY_BACKOFF_MAX)
 
         return CompletionResponse(
-            text=response,
+            text=text,
         )
 
     def stream_complete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
     ) -> CompletionResponseGen:
-        raise NotImplementedError
+        client = self._get_client()
+
+        invocation_params = {
+            **self._get_model_default_parameters,
+            **kwargs,
+            "prompt": [[prompt]],
+        }
+        model_name = kwargs.get("model_name", self.model_name)
+        request_id = new_request_id()
+
+        if self.triton_load_model_call:
+            client.load_model(model_name)
+
+        result_queue = client.request_streaming(
+            model_name, request_id, **invocation_params
+        )
+        interval = self.stream_interval_ms / 1000
+
+        def gen() -> CompletionResponseGen:
+            text = ""
+            try:
+                while True:
+                    try:
+                        tokens = result_queue.next_chunk(interval)
+                    except StopIteration:
+                        return
+                    for token in tokens:
+                        if isinstance(token, InferenceServerException):
+                            raise token
+                    delta = "".join(tokens)
+                    text += delta
+                    yield CompletionResponse(text=text, delta=delta)
+            finally:
+                # also stops the stream on an error, or when the caller stops
+                # iterating before the end
+                result_queue.close()
+
+        return gen()
 
+    @llm_chat_callback()
     async def achat(
         self, messages: Sequence[ChatMessage], **kwargs: Any
     ) -> ChatResponse:
-        raise NotImplementedError
+        completion_response = await self.acomplete(
+            generic_messages_to_prompt(messages), **kwargs
+        )
+        return completion_response_to_chat_response(completion_response)
+
+    async def _arequest_tokens(
+        self, prompt: str, **kwargs: Any
+    ) -> AsyncGenerator[str, None]:
+        client = self._get_aclient()
+
+        invocation_params = {
+            **self._get_model_default_parameters,
+            **kwargs,
+            "prompt": [[prompt]],
+        }
+        model_name = kwargs.get("model_name", self.model_name)
+        request_id = new_request_id()
+
+        try:
+            if self.triton_load_model_call:
+                await client.aload_model(model_name)
+
+            async for token in client.arequest_streaming(
+                model_name, request_id, **invocation_params
+            ):
+                yield token
+        finally:
+            # a client that isn't reused would otherwise leak its channel
+            if not self.reuse_client:
+                await client.close()
 
     async def acomplete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
     ) -> CompletionResponse:
-        raise NotImplementedError
+        tokens = [token async for token in self._arequest_tokens(prompt, **kwargs)]
 
+        return CompletionResponse(
+            text="".join(tokens),
+        )
+
+    @llm_chat_callback()
     async def astream_chat(
         self, messages: Sequence[ChatMessage], **kwargs: Any
     ) -> ChatResponseAsyncGen:
-        raise NotImplementedError
+        completion_response_gen = await self.astream_complete(
+            generic_messages_to_prompt(messages), **kwargs
+        )
+        return astream_completion_response_to_chat_response(completion_response_gen)
 
     async def astream_complete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
     ) -> CompletionResponseAsyncGen:
-        raise NotImplementedError
+        async def gen() -> CompletionResponseAsyncGen:
+            text = ""
+            async for token in self._arequest_tokens(prompt, **kwargs):
+                text = text + token
+                yield CompletionResponse(text=text, delta=token)
+
+        return gen()
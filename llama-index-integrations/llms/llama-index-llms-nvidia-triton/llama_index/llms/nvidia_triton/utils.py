@@ -25,16 +25,24 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import abc
-import json
+import asyncio
+import itertools
+import os
 import random
+import threading
 import time
+from collections import deque
 from functools import partial
-from queue import Queue
+from queue import Empty
 from typing import (
     Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Deque,
     Dict,
     List,
     Optional,
+    Tuple,
     Type,
     Union,
 )
@@ -42,13 +50,46 @@ from typing import (
 import numpy as np
 import tritonclient.grpc as grpcclient
 import tritonclient.http as httpclient
+from tritonclient.utils import np_to_triton_dtype
 
-STOP_WORDS = ["</s>"]
+STOP_WORDS = frozenset({"</s>"})
 RANDOM_SEED = 0
+# backoff (in seconds) between model readiness checks while a model loads
+LOAD_MODEL_BACKOFF_BASE = 0.1
+LOAD_MODEL_BACKOFF_MAX = 2.0
 
 
-class StreamingResponseGenerator(Queue):
-    """A Generator that provides the inference results from an LLM."""
+# request ids are unique within the process, and prefixed with its pid
+_request_counter = itertools.count(1)
+
+
+def new_request_id() -> str:
+    """Return a request id that no other request of this process uses."""
+    return f"{os.getpid()}-{next(_request_counter)}"
+
+
+def _jittered(delay: float) -> float:
+    """Add up to 50% random jitter to a backoff delay."""
+    return delay * (1 + random.random() * 0.5)  # nosec
+
+
+def _decode_text_output(np_res: Optional[np.ndarray]) -> str:
+    """Decode the `text_output` tensor of a response into a string."""
+    if np_res is None:
+        return ""
+    if np_res.size == 1:
+        # streamed responses carry a single token
+        return np_res.item().decode()
+    return "".join([token.decode() for token in np_res])
+
+
+class StreamingResponseGenerator:
+    """A Generator that provides the inference results from an LLM.
+
+    Results are put by a single producer (the stream callback) and taken by a
+    single consumer (the iterating caller), so a deque, whose append and popleft
+    are atomic, plus an event to wait on is enough; no queue lock is needed.
+    """
 
     def __init__(
         self,
@@ -59,27 +100,77 @@ class StreamingResponseGenerator(Queue):
         max_tokens: int,
     ) -> None:
         """Instantiate the generator class."""
-        super().__init__()
         self._client = client
         self.request_id = request_id
         self._batch = force_batch
         self._model_name = model_name
         self._max_tokens = max_tokens
         self._counter = 0
+        self._items: Deque[Any] = deque()
+        self._ready = threading.Event()
+        self._done = False
 
     def __iter__(self) -> "StreamingResponseGenerator":
         """Return self as a generator."""
         return self
 
+    def put(self, item: Any) -> None:
+        """Add a streamed result."""
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return the next streamed result, waiting for one if needed.
+
+        Raises `queue.Empty` if no result arrived within `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._items:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not self._ready.wait(remaining):
+                raise Empty
+            # re-checked by the loop, so a result put right before clearing is kept
+            self._ready.clear()
+        return self._items.popleft()
+
     def __next__(self) -> str:
         """Return the next retrieved token."""
-        val = self.get()
+        if self._done:
+            raise StopIteration
+        return self._accept(self.get())
+
+    def next_chunk(self, interval: float) -> List[Any]:
+        """Return the next token along with those received within `interval` seconds.
+
+        Lets a consumer handle a burst of tokens at once instead of one by one.
+        """
+        chunk = [next(self)]
+        deadline = time.monotonic() + interval
+        while not self._done:
+            try:
+                val = self.get(timeout=max(deadline - time.monotonic(), 0))
+                chunk.append(self._accept(val))
+            except (Empty, StopIteration):
+                break
+        return chunk
+
+    def _accept(self, val: Any) -> Any:
+        """Count a retrieved token, ending the stream on a stop condition."""
         if val is None or val in STOP_WORDS or self._counter == self._max_tokens - 1:
+            self._done = True
             self._stop_stream()
             raise StopIteration
         self._counter += 1
         return val
 
+    def close(self) -> None:
+        """Stop the Triton stream if it hasn't ended yet, e.g. when the consumer
+        stops iterating early; the client only supports one stream at a time.
+        """
+        if not self._done:
+            self._done = True
+            self._stop_stream()
+
     def _stop_stream(self) -> None:
         """Drain and shutdown the Triton stream."""
         self._client.stop_stream(
@@ -94,6 +185,8 @@ class _BaseTritonClient(abc.ABC):
         """Initialize the client."""
         self._server_url = server_url
         self._client = self._inference_server_client(server_url)
+        # sampling parameter tensors of the last request, keyed by their values
+        self._param_inputs: Optional[Tuple[Tuple[Any, ...], List[Any]]] = None
 
     @property
     @abc.abstractmethod
@@ -128,12 +221,14 @@ class _BaseTritonClient(abc.ABC):
 
         self._client.load_model(model_name)
         t0 = time.perf_counter()
-        t1 = t0
-        while not self._client.is_model_ready(model_name) and t1 - t0 < timeout:
-            t1 = time.perf_counter()
-
-        if not self._client.is_model_ready(model_name):
-            raise RuntimeError(f"Failed to load {model_name} on Triton in {timeout}s")
+        delay = LOAD_MODEL_BACKOFF_BASE
+        while not self._client.is_model_ready(model_name):
+            if time.perf_counter() - t0 >= timeout:
+                raise RuntimeError(
+                    f"Failed to load {model_name} on Triton in {timeout}s"
+                )
+            time.sleep(_jittered(delay))
+            delay = min(delay * 2, LOAD_MODEL_BACKOFF_MAX)
 
     def get_model_list(self) -> List[str]:
         """Get a list of models loaded in the triton server."""
@@ -176,8 +271,6 @@ class _BaseTritonClient(abc.ABC):
         self, name: str, input_data: Any
     ) -> Union["grpcclient.InferInput", "httpclient.InferInput"]:
         """Prepare an input data structure."""
-        from tritonclient.utils import np_to_triton_dtype
-
         t = self._infer_input(
             name, input_data.shape, np_to_triton_dtype(input_data.dtype)
         )
@@ -198,30 +291,53 @@ class _BaseTritonClient(abc.ABC):
     ) -> List[Union["grpcclient.InferInput", "httpclient.InferInput"]]:
         """Create the input for the triton inference server."""
         query = np.array(prompt).astype(object)
-        request_output_len = np.array([tokens]).astype(np.int32).reshape((1, -1))
-        runtime_top_k = np.array([top_k]).astype(np.int32).reshape((1, -1))
-        runtime_top_p = np.array([top_p]).astype(np.float32).reshape((1, -1))
-        temperature_array = np.array([temperature]).astype(np.float32).reshape((1, -1))
-        len_penalty = np.array([length_penalty]).astype(np.float32).reshape((1, -1))
-        repetition_penalty_array = (
-            np.array([repetition_penalty]).astype(np.float32).reshape((1, -1))
+
+        # the sampling parameters rarely change between requests, so their tensors
+        # are only rebuilt when one of them does
+        key = (
+            tokens,
+            temperature,
+            top_k,
+            top_p,
+            beam_width,
+            repetition_penalty,
+            length_penalty,
+            stream,
         )
-        random_seed = np.array([RANDOM_SEED]).astype(np.uint64).reshape((1, -1))
-        beam_width_array = np.array([beam_width]).astype(np.int32).reshape((1, -1))
-        streaming_data = np.array([[stream]], dtype=bool)
-
-        return [
-            self._prepare_tensor("text_input", query),
-            self._prepare_tensor("max_tokens", request_output_len),
-            self._prepare_tensor("top_k", runtime_top_k),
-            self._prepare_tensor("top_p", runtime_top_p),
-            self._prepare_tensor("temperature", temperature_array),
-            self._prepare_tensor("length_penalty", len_penalty),
-            self._prepare_tensor("repetition_penalty", repetition_penalty_array),
-            self._prepare_tensor("random_seed", random_seed),
-            self._prepare_tensor("beam_width", beam_width_array),
-            self._prepare_tensor("stream", streaming_data),
-        ]
+        param_inputs = self._param_inputs
+        if param_inputs is None or param_inputs[0] != key:
+            # one (1, 1) array per parameter, built directly in the wire dtype
+            request_output_len = np.full((1, 1), tokens, dtype=np.int32)
+            runtime_top_k = np.full((1, 1), top_k, dtype=np.int32)
+            runtime_top_p = np.full((1, 1), top_p, dtype=np.float32)
+            temperature_array = np.full((1, 1), temperature, dtype=np.float32)
+            len_penalty = np.full((1, 1), length_penalty, dtype=np.float32)
+            repetition_penalty_array = np.full(
+                (1, 1), repetition_penalty, dtype=np.float32
+            )
+            random_seed = np.full((1, 1), RANDOM_SEED, dtype=np.uint64)
+            beam_width_array = np.full((1, 1), beam_width, dtype=np.int32)
+            streaming_data = np.full((1, 1), stream, dtype=bool)
+
+            param_inputs = (
+                key,
+                [
+                    self._prepare_tensor("max_tokens", request_output_len),
+                    self._prepare_tensor("top_k", runtime_top_k),
+                    self._prepare_tensor("top_p", runtime_top_p),
+                    self._prepare_tensor("temperature", temperature_array),
+                    self._prepare_tensor("length_penalty", len_penalty),
+                    self._prepare_tensor(
+                        "repetition_penalty", repetition_penalty_array
+                    ),
+                    self._prepare_tensor("random_seed", random_seed),
+                    self._prepare_tensor("beam_width", beam_width_array),
+                    self._prepare_tensor("stream", streaming_data),
+                ],
+            )
+            self._param_inputs = param_inputs
+
+        return [self._prepare_tensor("text_input", query), *param_inputs[1]]
 
     def _trim_batch_response(self, result_str: str) -> str:
         """Trim the resulting response from a batch request by removing provided prompt and extra generated text."""
@@ -242,15 +358,11 @@ class GrpcTritonClient(_BaseTritonClient):
         self,
     ) -> Type["grpcclient.InferenceServerClient"]:
         """Return the preferred InferenceServerClient class."""
-        import tritonclient.grpc as grpcclient
-
         return grpcclient.InferenceServerClient  # type: ignore
 
     @property
     def _infer_input(self) -> Type["grpcclient.InferInput"]:
         """Return the preferred InferInput."""
-        import tritonclient.grpc as grpcclient
-
         return grpcclient.InferInput  # type: ignore
 
     @property
@@ -258,8 +370,6 @@ class GrpcTritonClient(_BaseTritonClient):
         self,
     ) -> Type["grpcclient.InferRequestedOutput"]:
         """Return the preferred InferRequestedOutput."""
-        import tritonclient.grpc as grpcclient
-
         return grpcclient.InferRequestedOutput  # type: ignore
 
     def _send_stop_signals(self, model_name: str, request_id: str) -> None:
@@ -273,27 +383,13 @@ class GrpcTritonClient(_BaseTritonClient):
         )
 
     @staticmethod
-    def _process_result(result: Dict[str, str]) -> str:
+    def _process_result(result: "grpcclient.InferResult") -> str:
         """Post-process the result from the server."""
-        import google.protobuf.json_format
-        import tritonclient.grpc as grpcclient
-        from tritonclient.grpc.service_pb2 import ModelInferResponse
-
-        message = ModelInferResponse()
-        generated_text: str = ""
-        google.protobuf.json_format.Parse(json.dumps(result), message)
-        infer_result = grpcclient.InferResult(message)
-        np_res = infer_result.as_numpy("text_output")
-
-        generated_text = ""
-        if np_res is not None:
-            generated_text = "".join([token.decode() for token in np_res])
-
-        return generated_text
+        return _decode_text_output(result.as_numpy("text_output"))
 
     def _stream_callback(
         self,
-        result_queue: Queue,
+        result_queue: StreamingResponseGenerator,
         force_batch: bool,
         result: Any,
         error: str,
@@ -302,10 +398,11 @@ class GrpcTritonClient(_BaseTritonClient):
         if error:
             result_queue.put(error)
         else:
-            response_raw = result.get_response(as_json=True)
-            if "outputs" in response_raw:
+            # read the response proto directly instead of round-tripping it via JSON
+            response_raw = result.get_response()
+            if response_raw.outputs:
                 # the very last response might have no output, just the final flag
-                response = self._process_result(response_raw)
+                response = self._process_result(result)
                 if force_batch:
                     response = self._trim_batch_response(response)
 
@@ -314,7 +411,7 @@ class GrpcTritonClient(_BaseTritonClient):
                 else:
                     result_queue.put(response)
 
-            if response_raw["parameters"]["triton_final_response"]["bool_param"]:
+            if response_raw.parameters["triton_final_response"].bool_param:
                 # end of the generation
                 result_queue.put(None)
 
@@ -351,7 +448,7 @@ class GrpcTritonClient(_BaseTritonClient):
             raise RuntimeError("Cannot request streaming, model is not loaded")
 
         if not request_id:
-            request_id = str(random.randint(1, 9999999))  # nosec
+            request_id = new_request_id()
 
         inputs = self._generate_inputs(stream=not force_batch, **params)
         result_queue = StreamingResponseGenerator(
@@ -375,3 +472,108 @@ class GrpcTritonClient(_BaseTritonClient):
         if signal:
             self._send_stop_signals(model_name, request_id)
         self._client.stop_stream()
+
+
+class AioGrpcTritonClient(_BaseTritonClient):
+    """Asyncio GRPC connection to a triton inference server.
+
+    Requests are sent over a single HTTP/2 channel, so concurrent streams from the
+    same event loop are multiplexed instead of each opening a connection.
+    """
+
+    @property
+    def _inference_server_client(
+        self,
+    ) -> Type["grpcclient.aio.InferenceServerClient"]:
+        """Return the preferred InferenceServerClient class."""
+        import tritonclient.grpc.aio as aiogrpcclient
+
+        return aiogrpcclient.InferenceServerClient  # type: ignore
+
+    @property
+    def _infer_input(self) -> Type["grpcclient.InferInput"]:
+        """Return the preferred InferInput."""
+        return grpcclient.InferInput  # type: ignore
+
+    @property
+    def _infer_output(
+        self,
+    ) -> Type["grpcclient.InferRequestedOutput"]:
+        """Return the preferred InferRequestedOutput."""
+        return grpcclient.InferRequestedOutput  # type: ignore
+
+    async def close(self) -> None:
+        """Close the channel to the server."""
+        await self._client.close()
+
+    async def aload_model(self, model_name: str, timeout: int = 1000) -> None:
+        """Load a model into the server."""
+        if await self._client.is_model_ready(model_name):
+            return
+
+        await self._client.load_model(model_name)
+        t0 = time.perf_counter()
+        delay = LOAD_MODEL_BACKOFF_BASE
+        while not await self._client.is_model_ready(model_name):
+            if time.perf_counter() - t0 >= timeout:
+                raise RuntimeError(
+                    f"Failed to load {model_name} on Triton in {timeout}s"
+                )
+            await asyncio.sleep(_jittered(delay))
+            delay = min(delay * 2, LOAD_MODEL_BACKOFF_MAX)
+
+    @staticmethod
+    def _process_result(result: "grpcclient.InferResult") -> str:
+        """Post-process the result from the server."""
+        return _decode_text_output(result.as_numpy("text_output"))
+
+    async def arequest_streaming(
+        self,
+        model_name: str,
+        request_id: Optional[str] = None,
+        force_batch: bool = False,
+        **params: Any,
+    ) -> AsyncGenerator[str, None]:
+        """Request a streaming connection and yield the generated tokens."""
+        if not await self._client.is_model_ready(model_name):
+            raise RuntimeError("Cannot request streaming, model is not loaded")
+
+        if not request_id:
+            request_id = new_request_id()
+
+        request = {
+            "model_name": model_name,
+            "inputs": self._generate_inputs(stream=not force_batch, **params),
+            "outputs": self._generate_outputs(),
+            "request_id": request_id,
+        }
+
+        async def inputs_iterator() -> AsyncIterator[Dict[str, Any]]:
+            yield request
+
+        max_tokens = params["tokens"]
+        counter = 0
+        responses = self._client.stream_infer(inputs_iterator())
+        try:
+            async for result, error in responses:
+                if error:
+                    raise error
+
+                response = result.get_response()
+                if response.outputs:
+                    # the very last response might have no output, just the final flag
+                    token = self._process_result(result)
+                    if force_batch:
+                        token = self._trim_batch_response(token)
+
+                    if token in STOP_WORDS or counter == max_tokens - 1:
+                        break
+                    counter += 1
+                    yield token
+
+                if response.parameters["triton_final_response"].bool_param:
+                    # end of the generation
+                    break
+        finally:
+            # closing the response stream cancels the call on the shared channel
+            await responses.aclose()
@@ -0,0 +1,75 @@
+import asyncio
+from typing import Any, AsyncGenerator, List
+
+from llama_index.core.base.llms.base import BaseLLM
+from llama_index.llms.nvidia_triton import NvidiaTriton
+from llama_index.llms.nvidia_triton.utils import StreamingResponseGenerator
+
+
+class FakeGrpcTritonClient:
+    """Streams the given tokens, allowing a single active stream like Triton's."""
+
+    def __init__(self, tokens: List[Any]) -> None:
+        self.tokens = tokens
+        self.streaming = False
+
+    def request_streaming(
+        self, model_name: str, request_id: str, **params: Any
+    ) -> StreamingResponseGenerator:
+        if self.streaming:
+            raise RuntimeError("cannot start another stream")
+        self.streaming = True
+        result_queue = StreamingResponseGenerator(
+            self, request_id, False, model_name, max_tokens=params["tokens"]
+        )
+        for token in self.tokens:
+            result_queue.put(token)
+        return result_queue
+
+    def stop_stream(self, model_name: str, request_id: str, signal: bool = True):
+        self.streaming = False
+
+
+class FakeAioGrpcTritonClient:
+    """Only usable on the event loop it was created on, like a grpc.aio channel."""
+
+    def __init__(self, server_url: str) -> None:
+        self.loop = asyncio.get_running_loop()
+
+    async def arequest_streaming(
+        self, model_name: str, request_id: str, **params: Any
+    ) -> AsyncGenerator[str, None]:
+        assert asyncio.get_running_loop() is self.loop
+        yield "Hello"
+
+
+def test_class():
+    names_of_base_classes = [b.__name__ for b in NvidiaTriton.__mro__]
+    assert BaseLLM.__name__ in names_of_base_classes
+
+
+def test_stream_complete_stopped_early():
+    llm = NvidiaTriton(reuse_client=True, stream_interval_ms=0)
+    llm._client = FakeGrpcTritonClient(["Hello", " world"])
+
+    stream = llm.stream_complete("Hi")
+    assert next(stream).text == "Hello world"
+    stream.close()
+    assert not llm._client.streaming
+
+    # the reused client can stream again
+    llm._client.tokens = ["Bye", None]
+    responses = list(llm.stream_complete("Hi"))
+    assert responses[-1].text == "Bye"
+    assert not llm._client.streaming
+
+
+def test_acomplete_on_separate_event_loops(monkeypatch):
+    monkeypatch.setattr(
+        "llama_index.llms.nvidia_triton.base.AioGrpcTritonClient",
+        FakeAioGrpcTritonClient,
+    )
+    llm = NvidiaTriton(reuse_client=True)
+
+    assert asyncio.run(llm.acomplete("Hi")).text == "Hello"
+    assert asyncio.run(llm.acomplete("Hi")).text == "Hello"
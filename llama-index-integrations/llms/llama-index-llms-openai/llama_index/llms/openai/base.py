@@ -555,12 +555,13 @@ class OpenAI(FunctionCallingLLM):
             return
         # NOTE: non-chat completion endpoint requires max_tokens to be set
         num_tokens = len(self._tokenizer.encode(prompt))
-        max_tokens = self.metadata.context_window - num_tokens
+        context_window = self.metadata.context_window
+        max_tokens = context_window - num_tokens
         if max_tokens <= 0:
             raise ValueError(
                 f"The prompt has {num_tokens} tokens, which is too long for"
                 " the model. Please use a prompt that fits within"
-                f" {self.metadata.context_window} tokens."
+                f" {context_window} tokens."
             )
         all_kwargs["max_tokens"] = max_tokens
 
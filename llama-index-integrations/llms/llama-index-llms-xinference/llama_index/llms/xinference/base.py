@@ -19,6 +19,7 @@ from llama_index.core.llms.callbacks import (
 from llama_index.core.llms.custom import CustomLLM
 from llama_index.core.types import BaseOutputParser, PydanticProgramMode
 from llama_index.llms.xinference.utils import (
+    prefetch,
     xinference_message_to_history,
     xinference_modelname_to_contextsize,
 )
@@ -226,7 +227,7 @@ class Xinference(CustomLLM):
 
         def gen() -> ChatResponseGen:
             text = ""
-            for c in response_iter:
+            for c in prefetch(response_iter):
                 delta = c["choices"][0]["delta"].get("content", "")
                 text += delta
                 yield ChatResponse(
@@ -275,7 +276,7 @@ class Xinference(CustomLLM):
 
         def gen() -> CompletionResponseGen:
             text = ""
-            for c in response_iter:
+            for c in prefetch(response_iter):
                 delta = c["choices"][0]["delta"].get("content", "")
                 text += delta
                 yield CompletionResponse(
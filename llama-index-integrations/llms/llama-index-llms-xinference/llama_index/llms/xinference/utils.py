@@ -1,4 +1,6 @@
-from typing import Optional
+import queue
+import threading
+from typing import Iterable, Iterator, List, Optional, TypeVar
 
 from llama_index.core.base.llms.types import ChatMessage
 from typing_extensions import NotRequired, TypedDict
@@ -15,6 +17,12 @@ XINFERENCE_MODEL_SIZES = {
     "llama-2": 4096,
 }
 
+# number of streamed chunks read ahead of the consumer
+PREFETCH_SIZE = 8
+
+T = TypeVar("T")
+_SENTINEL = object()
+
 
 class ChatCompletionMessage(TypedDict):
     role: str
@@ -36,3 +44,57 @@ def xinference_modelname_to_contextsize(modelname: str) -> int:
         )
 
     return context_size
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = PREFETCH_SIZE) -> Iterator[T]:
+    """Iterate over `iterable` while a background thread reads ahead of the consumer.
+
+    Keeps reading streamed chunks from the server while the caller is still
+    handling the previous ones. Errors raised by the iterable are re-raised to
+    the consumer, and the reader stops and closes the iterable (if it has a
+    `close` method) once the consumer stops iterating.
+    """
+    items: "queue.Queue[object]" = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+    errors: List[Exception] = []
+
+    def _put(item: object) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _close_source() -> None:
+        # ends the underlying stream (e.g. the HTTP response) rather than leaving
+        # it open until garbage collection
+        close = getattr(iterable, "close", None)
+        if callable(close):
+            try:
+                close()
+            except ValueError:
+                # a generator can't be closed while the producer is running it;
+                # the producer then closes it itself once it returns
+                pass
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(item):
+                    _close_source()
+                    return
+        except Exception as e:
+            errors.append(e)
+        _put(_SENTINEL)
+
+    threading.Thread(target=_produce, daemon=True).start()
+    try:
+        while (item := items.get()) is not _SENTINEL:
+            yield item  # type: ignore[misc]
+        if errors:
+            raise errors[0]
+    finally:
+        stopped.set()
+        _close_source()
@@ -1,7 +1,36 @@
+import threading
+
+import pytest
 from llama_index.core.base.llms.base import BaseLLM
 from llama_index.llms.xinference import Xinference
+from llama_index.llms.xinference.utils import prefetch
 
 
 def test_embedding_class():
     names_of_base_classes = [b.__name__ for b in Xinference.__mro__]
     assert BaseLLM.__name__ in names_of_base_classes
+
+
+def test_prefetch():
+    assert list(prefetch(iter(range(20)), maxsize=2)) == list(range(20))
+
+    def failing():
+        yield 1
+        raise ValueError("stream broke")
+
+    with pytest.raises(ValueError):
+        list(prefetch(failing()))
+
+    closed = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.set()
+
+    for _ in prefetch(endless(), maxsize=2):
+        break
+    # the source is closed when the consumer stops early
+    assert closed.wait(timeout=1)
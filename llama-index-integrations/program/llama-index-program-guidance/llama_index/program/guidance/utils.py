@@ -137,8 +137,9 @@ def parse_pydantic_from_guidance_program(
           So we call back to manually parsing the final text after program execution
     """
     try:
-        output = response.split("```json")[-1]
-        output = "```json" + output
+        # the response holds the whole transcript, only the part after the last
+        # json block marker is needed
+        output = "```json" + response.rpartition("```json")[2]
         if verbose:
             print("Raw output:")
             print(output)
@@ -6,9 +6,18 @@ related passages given a user query. For more information visit:
 https://developers.generativeai.google/guide
 """
 
+import dbm
+import hashlib
+import json
 import logging
+import threading
 import uuid
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, cast
 
 from llama_index.core.bridge.pydantic import (  # type: ignore
     BaseModel,
@@ -29,7 +38,41 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 _import_err_msg = "`google.generativeai` package not found, please run `pip install google-generativeai`"
+
+try:
+    import google.ai.generativelanguage as genai
+
+    import llama_index.vector_stores.google.genai_extension as genaix
+except ImportError:
+    raise ImportError(_import_err_msg)
+
 _default_doc_id = "default-doc"
+# maximum number of RPCs `GoogleVectorStore.add` issues at once
+_max_add_workers = 8
+# chunks created per `batch_create_chunk` call, the size of a single batch RPC
+_max_chunks_per_rpc = 100
+# maximum number of documents `GoogleVectorStore.query` searches at once
+_max_query_workers = 8
+_relevance_score = attrgetter("chunk_relevance_score")
+
+# retriever client shared by the stores created through `from_corpus` and
+# `create_corpus`, along with the config it was built with
+_shared_client: Optional[Tuple[Any, Any]] = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client() -> Any:
+    """Return the shared retriever client, building it on first use.
+
+    The client is rebuilt if `set_google_config` was called since, so that it
+    always uses the current endpoint and credentials.
+    """
+    global _shared_client
+    config = genaix.get_config()
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client[0] is not config:
+            _shared_client = (config, genaix.build_semantic_retriever())
+        return _shared_client[1]
 
 
 """Google GenerativeAI service context.
@@ -70,11 +113,6 @@ def set_google_config(
         )
         set_google_config(auth_credentials=credentials)
     """
-    try:
-        import llama_index.vector_stores.google.genai_extension as genaix
-    except ImportError:
-        raise ImportError(_import_err_msg)
-
     config_attrs = {
         "api_endpoint": api_endpoint,
         "user_agent": user_agent,
@@ -132,24 +170,30 @@ class GoogleVectorStore(BasePydanticVectorStore):
     metadata_keys: Optional[List[str]] = None
 
     _client: Any = PrivateAttr()
+    _cache: Any = PrivateAttr(default=None)
+    _cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
-    def __init__(self, *, client: Any, **kwargs: Any):
+    def __init__(
+        self, *, client: Any, cache_path: Optional[str] = None, **kwargs: Any
+    ):
         """Raw constructor.
 
         Use the class method `from_corpus` or `create_corpus` instead.
 
         Args:
             client: The low-level retriever class from google.ai.generativelanguage.
+            cache_path: Path of an on-disk cache of query results, kept across
+                processes. Meant for replaying queries (e.g. evaluations) against
+                a corpus that does not change; adding or deleting nodes through
+                this store clears it. The cache file is locked while open, so
+                only one store can use it at a time; call `close` to release it.
         """
-        try:
-            import google.ai.generativelanguage as genai
-        except ImportError:
-            raise ImportError(_import_err_msg)
-
         super().__init__(**kwargs)
 
         assert isinstance(client, genai.RetrieverServiceClient)
         self._client = client
+        if cache_path is not None:
+            self._cache = dbm.open(cache_path, "c")
 
     @classmethod
     def from_corpus(
@@ -158,6 +202,7 @@ class GoogleVectorStore(BasePydanticVectorStore):
         corpus_id: str,
         include_metadata: bool = False,
         metadata_keys: Optional[List[str]] = None,
+        cache_path: Optional[str] = None,
     ) -> "GoogleVectorStore":
         """Create an instance that points to an existing corpus.
 
@@ -168,6 +213,8 @@ class GoogleVectorStore(BasePydanticVectorStore):
             metadata_keys (Optional[List[str]], optional): Specifies which metadata keys to include
                 in the query results if include_metadata is set to True. If None, all metadata keys
                 are included. Defaults to None.
+            cache_path (Optional[str], optional): Path of an on-disk cache of query
+                results. Defaults to None, meaning results are not cached.
 
         Returns:
             An instance of the vector store that points to the specified corpus.
@@ -175,13 +222,8 @@ class GoogleVectorStore(BasePydanticVectorStore):
         Raises:
             NoSuchCorpusException if no such corpus is found.
         """
-        try:
-            import llama_index.vector_stores.google.genai_extension as genaix
-        except ImportError:
-            raise ImportError(_import_err_msg)
-
         _logger.debug(f"\n\nGoogleVectorStore.from_corpus(corpus_id={corpus_id})")
-        client = genaix.build_semantic_retriever()
+        client = _get_shared_client()
         if genaix.get_corpus(corpus_id=corpus_id, client=client) is None:
             raise NoSuchCorpusException(corpus_id=corpus_id)
 
@@ -190,6 +232,7 @@ class GoogleVectorStore(BasePydanticVectorStore):
             client=client,
             include_metadata=include_metadata,
             metadata_keys=metadata_keys,
+            cache_path=cache_path,
         )
 
     @classmethod
@@ -224,16 +267,11 @@ class GoogleVectorStore(BasePydanticVectorStore):
             An exception if the corpus already exists or the user hits the
             quota limit.
         """
-        try:
-            import llama_index.vector_stores.google.genai_extension as genaix
-        except ImportError:
-            raise ImportError(_import_err_msg)
-
         _logger.debug(
             f"\n\nGoogleVectorStore.create_corpus(new_corpus_id={corpus_id}, new_display_name={display_name})"
         )
 
-        client = genaix.build_semantic_retriever()
+        client = _get_shared_client()
         new_corpus_id = corpus_id or str(uuid.uuid4())
         new_corpus = genaix.create_corpus(
             corpus_id=new_corpus_id, display_name=display_name, client=client
@@ -286,19 +324,11 @@ class GoogleVectorStore(BasePydanticVectorStore):
         The above code will create one document with ID `doc-456` and title
         `Title for doc-456`. This document will house both nodes.
         """
-        try:
-            import llama_index.vector_stores.google.genai_extension as genaix
-
-            import google.ai.generativelanguage as genai
-        except ImportError:
-            raise ImportError(_import_err_msg)
-
         _logger.debug(f"\n\nGoogleVectorStore.add(nodes={nodes})")
 
         client = cast(genai.RetrieverServiceClient, self.client)
 
-        created_node_ids: List[str] = []
-        for nodeGroup in _group_nodes_by_source(nodes):
+        def add_document(nodeGroup: _NodeGroup) -> None:
             source = nodeGroup.source_node
             document_id = source.node_id
             document = genaix.get_document(
@@ -314,15 +344,45 @@ class GoogleVectorStore(BasePydanticVectorStore):
                     client=client,
                 )
 
+        def add_chunks(batch: Tuple[str, List[BaseNode]]) -> List[str]:
+            document_id, batch_nodes = batch
+            texts = []
+            metadatas = []
+            for node in batch_nodes:
+                texts.append(node.get_content())
+                metadatas.append(node.metadata)
             created_chunks = genaix.batch_create_chunk(
                 corpus_id=self.corpus_id,
                 document_id=document_id,
-                texts=[node.get_content() for node in nodeGroup.nodes],
-                metadatas=[node.metadata for node in nodeGroup.nodes],
+                texts=texts,
+                metadatas=metadatas,
                 client=client,
             )
-            created_node_ids.extend([chunk.name for chunk in created_chunks])
+            return [chunk.name for chunk in created_chunks]
+
+        # the documents, and the chunk batches of one RPC each, are independent,
+        # so their RPCs are issued concurrently
+        nodeGroups = _group_nodes_by_source(nodes)
+        chunk_batches = [
+            (group.source_node.node_id, group.nodes[i : i + _max_chunks_per_rpc])
+            for group in nodeGroups
+            for i in range(0, len(group.nodes), _max_chunks_per_rpc)
+        ]
+        if len(chunk_batches) <= 1:
+            for group in nodeGroups:
+                add_document(group)
+            created_ids_per_batch = [add_chunks(batch) for batch in chunk_batches]
+        else:
+            max_workers = min(len(chunk_batches), _max_add_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # all the documents have to exist before their chunks are added
+                list(pool.map(add_document, nodeGroups))
+                created_ids_per_batch = list(pool.map(add_chunks, chunk_batches))
 
+        created_node_ids: List[str] = []
+        for created_ids in created_ids_per_batch:
+            created_node_ids.extend(created_ids)
+        self._clear_cache()
         return created_node_ids
 
     def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
@@ -334,19 +394,13 @@ class GoogleVectorStore(BasePydanticVectorStore):
         Args:
             ref_doc_id: The document ID to be deleted.
         """
-        try:
-            import llama_index.vector_stores.google.genai_extension as genaix
-
-            import google.ai.generativelanguage as genai
-        except ImportError:
-            raise ImportError(_import_err_msg)
-
         _logger.debug(f"\n\nGoogleVectorStore.delete(ref_doc_id={ref_doc_id})")
 
         client = cast(genai.RetrieverServiceClient, self.client)
         genaix.delete_document(
             corpus_id=self.corpus_id, document_id=ref_doc_id, client=client
         )
+        self._clear_cache()
 
     def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
         """Query vector store.
@@ -375,19 +429,40 @@ class GoogleVectorStore(BasePydanticVectorStore):
         Args:
             query: See `llama_index.core.vector_stores.types.VectorStoreQuery`.
         """
-        try:
-            import llama_index.vector_stores.google.genai_extension as genaix
-
-            import google.ai.generativelanguage as genai
-        except ImportError:
-            raise ImportError(_import_err_msg)
-
         _logger.debug(f"\n\nGoogleVectorStore.query(query={query})")
 
         query_str = query.query_str
         if query_str is None:
             raise ValueError("VectorStoreQuery.query_str should not be None.")
 
+        if self._cache is None:
+            return self._query(query, query_str)
+
+        key = self._cache_key(query, query_str)
+        with self._cache_lock:
+            # re-checked under the lock, as `close` may have run meanwhile
+            cached = self._cache.get(key) if self._cache is not None else None
+        if cached is not None:
+            return _load_query_result(cached)
+
+        result = self._query(query, query_str)
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache[key] = _dump_query_result(result)
+                self._sync_cache()
+        return result
+
+    def close(self) -> None:
+        """Close the query cache, so that another store can open its file.
+
+        Queries made afterwards are no longer cached.
+        """
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
+
+    def _query(self, query: VectorStoreQuery, query_str: str) -> VectorStoreQueryResult:
         client = cast(genai.RetrieverServiceClient, self.client)
 
         relevant_chunks: List[genai.RelevantChunk] = []
@@ -402,22 +477,34 @@ class GoogleVectorStore(BasePydanticVectorStore):
                 client=client,
             )
         else:
-            for doc_id in query.doc_ids:
-                relevant_chunks.extend(
-                    genaix.query_document(
-                        corpus_id=self.corpus_id,
-                        document_id=doc_id,
-                        query=query_str,
-                        filter=_convert_filter(query.filters),
-                        k=query.similarity_top_k,
-                        client=client,
-                    )
+            metadata_filter = _convert_filter(query.filters)
+
+            def query_document(doc_id: str) -> List[genai.RelevantChunk]:
+                return genaix.query_document(
+                    corpus_id=self.corpus_id,
+                    document_id=doc_id,
+                    query=query_str,
+                    filter=metadata_filter,
+                    k=query.similarity_top_k,
+                    client=client,
                 )
+
+            # the documents are queried concurrently
+            if len(query.doc_ids) <= 1:
+                chunks_per_doc = [query_document(d) for d in query.doc_ids]
+            else:
+                max_workers = min(len(query.doc_ids), _max_query_workers)
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    chunks_per_doc = list(pool.map(query_document, query.doc_ids))
+            for chunks in chunks_per_doc:
+                relevant_chunks.extend(chunks)
             # Make sure the chunks are reversed sorted according to relevant
             # scores even across multiple documents.
-            relevant_chunks.sort(key=lambda c: c.chunk_relevance_score, reverse=True)
+            relevant_chunks.sort(key=_relevance_score, reverse=True)
 
         nodes = []
+        ids = []
+        similarities = []
         include_metadata = self.include_metadata
         metadata_keys = self.metadata_keys
         for chunk in relevant_chunks:
@@ -436,26 +523,68 @@ class GoogleVectorStore(BasePydanticVectorStore):
                     ):
                         metadata[custom_metadata.key] = value
 
+            chunk_id = _extract_chunk_id(chunk.chunk.name)
             text_node = TextNode(
                 text=chunk.chunk.data.string_value,
-                id=_extract_chunk_id(chunk.chunk.name),
+                id_=chunk_id,
                 metadata=metadata,  # Adding metadata to the node
             )
             nodes.append(text_node)
+            ids.append(chunk_id)
+            similarities.append(chunk.chunk_relevance_score)
+
+        return VectorStoreQueryResult(nodes=nodes, ids=ids, similarities=similarities)
+
+    def _cache_key(self, query: VectorStoreQuery, query_str: str) -> str:
+        # everything the result depends on
+        key = [
+            self.corpus_id,
+            query_str,
+            sorted(_convert_filter(query.filters).items()),
+            query.similarity_top_k,
+            query.doc_ids,
+            self.include_metadata,
+            self.metadata_keys,
+        ]
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def _clear_cache(self) -> None:
+        with self._cache_lock:
+            if self._cache is None:
+                return
+            for key in list(self._cache.keys()):
+                del self._cache[key]
+            self._sync_cache()
+
+    def _sync_cache(self) -> None:
+        # not every dbm backend writes through, so flush explicitly when possible
+        if hasattr(self._cache, "sync"):
+            self._cache.sync()
+
+
+def _dump_query_result(result: VectorStoreQueryResult) -> bytes:
+    # stored as compressed JSON rather than pickled, so that loading a cache
+    # file can never run code
+    data = {
+        "nodes": [node.to_dict() for node in result.nodes or []],
+        "ids": result.ids,
+        "similarities": result.similarities,
+    }
+    return zlib.compress(json.dumps(data).encode())
 
-        return VectorStoreQueryResult(
-            nodes=nodes,
-            ids=[_extract_chunk_id(chunk.chunk.name) for chunk in relevant_chunks],
-            similarities=[chunk.chunk_relevance_score for chunk in relevant_chunks],
-        )
 
+def _load_query_result(dumped: bytes) -> VectorStoreQueryResult:
+    data = json.loads(zlib.decompress(dumped))
+    return VectorStoreQueryResult(
+        nodes=[TextNode.from_dict(node) for node in data["nodes"]],
+        ids=data["ids"],
+        similarities=data["similarities"],
+    )
 
-def _extract_chunk_id(entity_name: str) -> str:
-    try:
-        import llama_index.vector_stores.google.genai_extension as genaix
-    except ImportError:
-        raise ImportError(_import_err_msg)
 
+# chunks matching repeated queries come back with the same names
+@lru_cache(maxsize=4096)
+def _extract_chunk_id(entity_name: str) -> str:
     id = genaix.EntityName.from_str(entity_name).chunk_id
     assert id is not None
     return id
@@ -472,20 +601,25 @@ def _group_nodes_by_source(nodes: Sequence[BaseNode]) -> List[_NodeGroup]:
     """Returns a list of lists of nodes where each list has all the nodes
     from the same document.
     """
-    groups: Dict[str, _NodeGroup] = {}
+    groups: Dict[str, List[BaseNode]] = defaultdict(list)
+    sources: Dict[str, RelatedNodeInfo] = {}
+    default_source: Optional[RelatedNodeInfo] = None
     for node in nodes:
-        source_node: RelatedNodeInfo
-        if isinstance(node.source_node, RelatedNodeInfo):
-            source_node = node.source_node
-        else:
-            source_node = RelatedNodeInfo(node_id=_default_doc_id)
-
-        if source_node.node_id not in groups:
-            groups[source_node.node_id] = _NodeGroup(source_node=source_node, nodes=[])
-
-        groups[source_node.node_id].nodes.append(node)
-
-    return list(groups.values())
+        source_node = node.source_node
+        if not isinstance(source_node, RelatedNodeInfo):
+            if default_source is None:
+                default_source = RelatedNodeInfo(node_id=_default_doc_id)
+            source_node = default_source
+
+        sources.setdefault(source_node.node_id, source_node)
+        groups[source_node.node_id].append(node)
+
+    # the sources and nodes are models already, so there is nothing to validate
+    # (validating would also copy every node)
+    return [
+        _NodeGroup.construct(source_node=sources[source_id], nodes=group)
+        for source_id, group in groups.items()
+    ]
 
 
 def _convert_filter(fs: Optional[MetadataFilters]) -> Dict[str, Any]:
@@ -1,7 +1,93 @@
-from llama_index.core.vector_stores.types import BasePydanticVectorStore
+from unittest.mock import MagicMock
+
+import google.ai.generativelanguage as genai
+
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores.types import (
+    BasePydanticVectorStore,
+    VectorStoreQuery,
+)
 from llama_index.vector_stores.google import GoogleVectorStore
+from llama_index.vector_stores.google.base import _extract_chunk_id
 
 
 def test_class():
     names_of_base_classes = [b.__name__ for b in GoogleVectorStore.__mro__]
     assert BasePydanticVectorStore.__name__ in names_of_base_classes
+
+
+def _mock_client() -> MagicMock:
+    client = MagicMock(spec=genai.RetrieverServiceClient)
+    client.query_corpus.return_value = genai.QueryCorpusResponse(
+        relevant_chunks=[
+            genai.RelevantChunk(
+                chunk_relevance_score=0.9,
+                chunk=genai.Chunk(
+                    name="corpora/123/documents/456/chunks/789",
+                    data=genai.ChunkData(string_value="42"),
+                ),
+            )
+        ]
+    )
+    client.get_document.return_value = genai.Document(
+        name="corpora/123/documents/456"
+    )
+    client.batch_create_chunks.return_value = genai.BatchCreateChunksResponse(
+        chunks=[genai.Chunk(name="corpora/123/documents/456/chunks/790")]
+    )
+    return client
+
+
+def test_extract_chunk_id():
+    assert _extract_chunk_id("corpora/123/documents/456/chunks/789") == "789"
+    # repeated names are served from the cache
+    hits = _extract_chunk_id.cache_info().hits
+    assert _extract_chunk_id("corpora/123/documents/456/chunks/789") == "789"
+    assert _extract_chunk_id.cache_info().hits == hits + 1
+
+
+def test_query_cache(tmp_path):
+    client = _mock_client()
+    store = GoogleVectorStore(
+        corpus_id="123", client=client, cache_path=str(tmp_path / "cache")
+    )
+    query = VectorStoreQuery(query_str="What is the meaning of life?")
+
+    result = store.query(query)
+    cached = store.query(query)
+    assert client.query_corpus.call_count == 1
+    assert cached.ids == result.ids == ["789"]
+    assert cached.similarities == result.similarities
+    assert cached.nodes[0].get_content() == "42"
+
+    # adding nodes invalidates the cache
+    store.add([TextNode(text="Hello")])
+    store.query(query)
+    assert client.query_corpus.call_count == 2
+
+    # and so does deleting them
+    store.delete("456")
+    store.query(query)
+    assert client.query_corpus.call_count == 3
+
+
+def test_query_cache_reopened(tmp_path):
+    cache_path = str(tmp_path / "cache")
+    query = VectorStoreQuery(query_str="What is the meaning of life?")
+    client = _mock_client()
+    store = GoogleVectorStore(corpus_id="123", client=client, cache_path=cache_path)
+    store.query(query)
+    store.close()
+
+    # the closed store no longer caches
+    store.query(query)
+    assert client.query_corpus.call_count == 2
+
+    # another store reopens the cache file and finds the result there
+    other_client = _mock_client()
+    other = GoogleVectorStore(
+        corpus_id="123", client=other_client, cache_path=cache_path
+    )
+    assert other.query(query).ids == ["789"]
+    assert other_client.query_corpus.call_count == 0
+    other.close()
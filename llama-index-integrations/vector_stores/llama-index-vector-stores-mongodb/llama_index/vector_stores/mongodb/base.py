@@ -6,12 +6,17 @@ An index that is built on top of an existing vector store.
 
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import version
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, cast
 
 from llama_index.core.bridge.pydantic import PrivateAttr
 from llama_index.core.schema import BaseNode, MetadataMode, TextNode
 from llama_index.core.vector_stores.types import (
+    FilterCondition,
+    FilterOperator,
     MetadataFilters,
     BasePydanticVectorStore,
     VectorStoreQuery,
@@ -27,12 +32,80 @@ from pymongo.driver_info import DriverInfo
 
 logger = logging.getLogger(__name__)
 
+# upper bound on the queries `batch_query` runs concurrently
+DEFAULT_BATCH_QUERY_WORKERS = 16
+
+# clients built from MONGO_URI, shared by all the stores using the same URI so
+# that they share one connection pool
+_client_cache: Dict[str, MongoClient] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _get_shared_client(uri: str) -> MongoClient:
+    with _client_cache_lock:
+        client = _client_cache.get(uri)
+        if client is None:
+            client = MongoClient(
+                uri,
+                driver=DriverInfo(name="llama-index", version=version("llama-index")),
+            )
+            _client_cache[uri] = client
+        return client
+
+
+# exact matches are expressed as plain equality, the other operators as below
+_filter_operators = {
+    FilterOperator.NE: "$ne",
+    FilterOperator.GT: "$gt",
+    FilterOperator.GTE: "$gte",
+    FilterOperator.LT: "$lt",
+    FilterOperator.LTE: "$lte",
+    FilterOperator.IN: "$in",
+    FilterOperator.NIN: "$nin",
+}
+
+
+def _copy_query_result(result: VectorStoreQueryResult) -> VectorStoreQueryResult:
+    # callers (e.g. postprocessors) modify the returned nodes in place, so every
+    # caller gets its own copy of a cached result
+    return VectorStoreQueryResult(
+        nodes=[node.copy(deep=True) for node in result.nodes or []],
+        similarities=list(result.similarities or []),
+        ids=list(result.ids or []),
+    )
+
 
 def _to_mongodb_filter(standard_filters: MetadataFilters) -> Dict:
     """Convert from standard dataclass to filter dict."""
-    filters = {}
-    for filter in standard_filters.legacy_filters():
-        filters[filter.key] = filter.value
+    clauses = []
+    for filter in standard_filters.filters:
+        if isinstance(filter, MetadataFilters):
+            nested = _to_mongodb_filter(filter)
+            if nested:
+                clauses.append(nested)
+        elif filter.operator == FilterOperator.EQ:
+            clauses.append({filter.key: filter.value})
+        elif filter.operator in _filter_operators:
+            operator = _filter_operators[filter.operator]
+            clauses.append({filter.key: {operator: filter.value}})
+        else:
+            raise ValueError(f"Filter operator {filter.operator} is not supported.")
+
+    # MongoDB rejects an empty $or or $and, and no clauses means no filter
+    if not clauses:
+        return {}
+    if len(clauses) == 1:
+        return clauses[0]
+    if standard_filters.condition == FilterCondition.OR:
+        return {"$or": clauses}
+
+    # conditions on distinct keys are combined in a single document, which
+    # MongoDB treats as an implicit $and
+    filters: Dict[str, Any] = {}
+    for clause in clauses:
+        if filters.keys() & clause.keys():
+            return {"$and": clauses}
+        filters.update(clause)
     return filters
 
 
@@ -83,6 +156,11 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
         # Create an instance of MongoDBAtlasVectorSearch
         vector_store = MongoDBAtlasVectorSearch(mongodb_client)
         ```
+
+    A client passed in as ``mongodb_client`` is only used by that store. When
+    no client is passed, the client is built from the ``MONGO_URI`` environment
+    variable and shared by every store built from the same URI, so the
+    ``client`` of such a store must not be closed.
     """
 
     stores_text: bool = True
@@ -90,12 +168,19 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
 
     _mongodb_client: Any = PrivateAttr()
     _collection: Any = PrivateAttr()
+    _async_collection: Any = PrivateAttr()
     _index_name: str = PrivateAttr()
     _embedding_key: str = PrivateAttr()
     _id_key: str = PrivateAttr()
     _text_key: str = PrivateAttr()
     _metadata_key: str = PrivateAttr()
     _insert_kwargs: Dict = PrivateAttr()
+    _num_candidates_multiplier: int = PrivateAttr()
+    _project_stage: Dict[str, Any] = PrivateAttr()
+    _query_cache: "OrderedDict[Tuple, VectorStoreQueryResult]" = PrivateAttr()
+    _query_cache_size: int = PrivateAttr()
+    _query_cache_lock: threading.Lock = PrivateAttr()
+    _query_cache_generation: int = PrivateAttr()
 
     def __init__(
         self,
@@ -108,12 +193,16 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
         text_key: str = "text",
         metadata_key: str = "metadata",
         insert_kwargs: Optional[Dict] = None,
+        query_cache_size: int = 0,
+        num_candidates_multiplier: int = 10,
+        async_mongodb_client: Optional[Any] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the vector store.
 
         Args:
-            mongodb_client: A MongoDB client.
+            mongodb_client: A MongoDB client. If not given, a client shared by
+            the stores using the same MONGO_URI is used.
             db_name: A MongoDB database name.
             collection_name: A MongoDB collection name.
             index_name: A MongoDB Atlas Vector Search index name.
@@ -124,6 +213,14 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
             metadata_key: A MongoDB field that will contain
             the metadata for each document.
             insert_kwargs: The kwargs used during `insert`.
+            query_cache_size: The number of query results to keep in memory
+            (least recently used first out), 0 to disable caching. Results are
+            dropped when nodes are added or deleted through this store, but not
+            when the collection is modified elsewhere.
+            num_candidates_multiplier: The number of nearest neighbors considered
+            by the search, as a multiple of the number of results requested.
+            async_mongodb_client: A motor `AsyncIOMotorClient` used by the async
+            methods, which otherwise run the sync methods.
         """
         if mongodb_client is not None:
             self._mongodb_client = cast(MongoClient, mongodb_client)
@@ -133,18 +230,27 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
                     "Must specify MONGO_URI via env variable "
                     "if not directly passing in client."
                 )
-            self._mongodb_client = MongoClient(
-                os.environ["MONGO_URI"],
-                driver=DriverInfo(name="llama-index", version=version("llama-index")),
-            )
+            self._mongodb_client = _get_shared_client(os.environ["MONGO_URI"])
 
         self._collection = self._mongodb_client[db_name][collection_name]
+        self._async_collection = (
+            async_mongodb_client[db_name][collection_name]
+            if async_mongodb_client is not None
+            else None
+        )
         self._index_name = index_name
         self._embedding_key = embedding_key
         self._id_key = id_key
         self._text_key = text_key
         self._metadata_key = metadata_key
         self._insert_kwargs = insert_kwargs or {}
+        self._num_candidates_multiplier = num_candidates_multiplier
+        # the same for every query, so only built once
+        self._project_stage = self._build_project_stage()
+        self._query_cache = OrderedDict()
+        self._query_cache_size = query_cache_size
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_generation = 0
 
         super().__init__()
 
@@ -162,27 +268,51 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
             A List of ids for successfully added nodes.
 
         """
-        ids = []
-        data_to_insert = []
-        for node in nodes:
-            metadata = node_to_metadata_dict(
-                node, remove_text=True, flat_metadata=self.flat_metadata
-            )
+        data_to_insert = self._to_documents(nodes)
+        logger.debug("Inserting data into MongoDB: %s", data_to_insert)
+        # the documents are independent, so let the server insert them unordered
+        # (pymongo already splits large inserts into batches under the size limit)
+        insert_result = self._collection.insert_many(
+            data_to_insert, **{"ordered": False, **self._insert_kwargs}
+        )
+        logger.debug("Result of insert: %s", insert_result)
+        self._clear_query_cache()
+        return [node.node_id for node in nodes]
+
+    async def async_add(self, nodes: List[BaseNode], **kwargs: Any) -> List[str]:
+        """Asynchronously add nodes to index.
+
+        Args:
+            nodes: List[BaseNode]: list of nodes with embeddings
+
+        Returns:
+            A List of ids for successfully added nodes.
+
+        """
+        if self._async_collection is None:
+            return self.add(nodes, **kwargs)
+
+        data_to_insert = self._to_documents(nodes)
+        logger.debug("Inserting data into MongoDB: %s", data_to_insert)
+        insert_result = await self._async_collection.insert_many(
+            data_to_insert, **{"ordered": False, **self._insert_kwargs}
+        )
+        logger.debug("Result of insert: %s", insert_result)
+        self._clear_query_cache()
+        return [node.node_id for node in nodes]
 
-            entry = {
+    def _to_documents(self, nodes: List[BaseNode]) -> List[Dict[str, Any]]:
+        return [
+            {
                 self._id_key: node.node_id,
                 self._embedding_key: node.get_embedding(),
                 self._text_key: node.get_content(metadata_mode=MetadataMode.NONE) or "",
-                self._metadata_key: metadata,
+                self._metadata_key: node_to_metadata_dict(
+                    node, remove_text=True, flat_metadata=self.flat_metadata
+                ),
             }
-            data_to_insert.append(entry)
-            ids.append(node.node_id)
-        logger.debug("Inserting data into MongoDB: %s", data_to_insert)
-        insert_result = self._collection.insert_many(
-            data_to_insert, **self._insert_kwargs
-        )
-        logger.debug("Result of insert: %s", insert_result)
-        return ids
+            for node in nodes
+        ]
 
     def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
         """
@@ -196,44 +326,69 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
         self._collection.delete_one(
             filter={self._metadata_key + ".ref_doc_id": ref_doc_id}, **delete_kwargs
         )
+        self._clear_query_cache()
+
+    async def adelete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
+        """
+        Asynchronously delete nodes using with ref_doc_id.
+
+        Args:
+            ref_doc_id (str): The doc_id of the document to delete.
+
+        """
+        if self._async_collection is None:
+            self.delete(ref_doc_id, **delete_kwargs)
+            return
+
+        await self._async_collection.delete_one(
+            filter={self._metadata_key + ".ref_doc_id": ref_doc_id}, **delete_kwargs
+        )
+        self._clear_query_cache()
 
     @property
     def client(self) -> Any:
         """Return MongoDB client."""
         return self._mongodb_client
 
-    def _query(self, query: VectorStoreQuery) -> VectorStoreQueryResult:
+    def _build_pipeline(self, query: VectorStoreQuery) -> List[Dict[str, Any]]:
         params: Dict[str, Any] = {
             "queryVector": query.query_embedding,
             "path": self._embedding_key,
-            "numCandidates": query.similarity_top_k * 10,
+            "numCandidates": query.similarity_top_k * self._num_candidates_multiplier,
             "limit": query.similarity_top_k,
             "index": self._index_name,
         }
-        if query.filters:
-            params["filter"] = _to_mongodb_filter(query.filters)
+        mongodb_filter = _to_mongodb_filter(query.filters) if query.filters else None
+        if mongodb_filter:
+            params["filter"] = mongodb_filter
 
         query_field = {"$vectorSearch": params}
 
-        pipeline = [
-            query_field,
+        return [query_field, self._project_stage]
+
+    def _build_project_stage(self) -> Dict[str, Any]:
+        # only return the fields the results are built from (`_id` only when it is
+        # the id key)
+        projection: Dict[str, Any] = {"_id": 0}
+        projection.update(
             {
-                "$project": {
-                    "score": {"$meta": "vectorSearchScore"},
-                    self._embedding_key: 0,
-                }
-            },
-        ]
-        logger.debug("Running query pipeline: %s", pipeline)
-        cursor = self._collection.aggregate(pipeline)  # type: ignore
+                self._id_key: 1,
+                self._text_key: 1,
+                self._metadata_key: 1,
+                "score": {"$meta": "vectorSearchScore"},
+            }
+        )
+        return {"$project": projection}
+
+    def _to_query_result(self, cursor: Iterable[Dict]) -> VectorStoreQueryResult:
         top_k_nodes = []
         top_k_ids = []
         top_k_scores = []
         for res in cursor:
-            text = res.pop(self._text_key)
-            score = res.pop("score")
-            id = res.pop(self._id_key)
-            metadata_dict = res.pop(self._metadata_key)
+            text = res[self._text_key]
+            score = res["score"]
+            id = res[self._id_key]
+            metadata_dict = res[self._metadata_key]
 
             try:
                 node = metadata_dict_to_node(metadata_dict)
@@ -256,9 +411,18 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
             top_k_ids.append(id)
             top_k_nodes.append(node)
             top_k_scores.append(score)
-        result = VectorStoreQueryResult(
+        return VectorStoreQueryResult(
             nodes=top_k_nodes, similarities=top_k_scores, ids=top_k_ids
         )
+
+    def _query(self, query: VectorStoreQuery) -> VectorStoreQueryResult:
+        pipeline = self._build_pipeline(query)
+        logger.debug("Running query pipeline: %s", pipeline)
+        # fetch all the results in the first batch rather than paging for them
+        cursor = self._collection.aggregate(  # type: ignore
+            pipeline, batchSize=query.similarity_top_k
+        )
+        result = self._to_query_result(cursor)
         logger.debug("Result of query: %s", result)
         return result
 
@@ -271,4 +435,108 @@ class MongoDBAtlasVectorSearch(BasePydanticVectorStore):
         Returns:
             A VectorStoreQueryResult containing the results of the query.
         """
-        return self._query(query)
+        if not self._query_cache_size:
+            return self._query(query)
+
+        key = self._query_cache_key(query)
+        result, generation = self._get_cached_result(key)
+        if result is None:
+            result = self._query(query)
+            self._cache_result(key, generation, result)
+        return result
+
+    async def _aquery(self, query: VectorStoreQuery) -> VectorStoreQueryResult:
+        pipeline = self._build_pipeline(query)
+        logger.debug("Running query pipeline: %s", pipeline)
+        cursor = self._async_collection.aggregate(
+            pipeline, batchSize=query.similarity_top_k
+        )
+        result = self._to_query_result(await cursor.to_list(length=None))
+        logger.debug("Result of query: %s", result)
+        return result
+
+    async def aquery(
+        self, query: VectorStoreQuery, **kwargs: Any
+    ) -> VectorStoreQueryResult:
+        """Asynchronously query index for top k most similar nodes.
+
+        Args:
+            query: a VectorStoreQuery object.
+
+        Returns:
+            A VectorStoreQueryResult containing the results of the query.
+        """
+        if self._async_collection is None:
+            return self.query(query, **kwargs)
+        if not self._query_cache_size:
+            return await self._aquery(query)
+
+        key = self._query_cache_key(query)
+        result, generation = self._get_cached_result(key)
+        if result is None:
+            result = await self._aquery(query)
+            self._cache_result(key, generation, result)
+        return result
+
+    def _query_cache_key(self, query: VectorStoreQuery) -> Tuple:
+        return (
+            tuple(query.query_embedding or ()),
+            query.similarity_top_k,
+            repr(sorted(_to_mongodb_filter(query.filters).items()))
+            if query.filters
+            else None,
+        )
+
+    def _get_cached_result(
+        self, key: Tuple
+    ) -> Tuple[Optional[VectorStoreQueryResult], int]:
+        """Return the cached result for `key` (if any) and the cache generation."""
+        with self._query_cache_lock:
+            result = self._query_cache.get(key)
+            if result is None:
+                return None, self._query_cache_generation
+            self._query_cache.move_to_end(key)
+            generation = self._query_cache_generation
+        return _copy_query_result(result), generation
+
+    def _cache_result(
+        self, key: Tuple, generation: int, result: VectorStoreQueryResult
+    ) -> None:
+        result = _copy_query_result(result)
+        with self._query_cache_lock:
+            # don't cache a result that nodes added or deleted meanwhile made stale
+            if generation == self._query_cache_generation:
+                self._query_cache[key] = result
+                if len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+
+    def _clear_query_cache(self) -> None:
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self._query_cache_generation += 1
+
+    def batch_query(
+        self,
+        queries: Sequence[VectorStoreQuery],
+        max_workers: int = DEFAULT_BATCH_QUERY_WORKERS,
+        **kwargs: Any,
+    ) -> List[VectorStoreQueryResult]:
+        """Query index for several queries at once.
+
+        The queries run concurrently over the client's connection pool, so the
+        total latency is close to that of the slowest query rather than the sum.
+        (`$vectorSearch` has to be the first stage of its own pipeline, so the
+        queries cannot be combined into a single aggregation.)
+
+        Args:
+            queries: the VectorStoreQuery objects to run.
+            max_workers: the maximum number of queries run concurrently.
+
+        Returns:
+            A VectorStoreQueryResult per query, in the order of `queries`.
+        """
+        if len(queries) <= 1:
+            return [self.query(query) for query in queries]
+
+        with ThreadPoolExecutor(max_workers=min(len(queries), max_workers)) as pool:
+            return list(pool.map(self.query, queries))
@@ -1,7 +1,150 @@
-from llama_index.core.vector_stores.types import BasePydanticVectorStore
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from llama_index.core.vector_stores.types import (
+    BasePydanticVectorStore,
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+    VectorStoreQuery,
+)
 from llama_index.vector_stores.mongodb import MongoDBAtlasVectorSearch
+from llama_index.vector_stores.mongodb.base import _to_mongodb_filter
 
 
 def test_class():
     names_of_base_classes = [b.__name__ for b in MongoDBAtlasVectorSearch.__mro__]
     assert BasePydanticVectorStore.__name__ in names_of_base_classes
+
+
+def test_batch_query():
+    def aggregate(pipeline, **kwargs):
+        query_vector = pipeline[0]["$vectorSearch"]["queryVector"]
+        return [
+            {
+                "id": f"node-{query_vector[0]}",
+                "text": "text",
+                "score": query_vector[0],
+                "metadata": {},
+            }
+        ]
+
+    client = MagicMock()
+    client["default_db"]["default_collection"].aggregate.side_effect = aggregate
+    vector_store = MongoDBAtlasVectorSearch(mongodb_client=client)
+
+    queries = [
+        VectorStoreQuery(query_embedding=[float(i)], similarity_top_k=1)
+        for i in range(5)
+    ]
+    results = vector_store.batch_query(queries)
+
+    assert [result.ids for result in results] == [
+        [f"node-{float(i)}"] for i in range(5)
+    ]
+
+
+def test_query_cache():
+    client = MagicMock()
+    collection = client["default_db"]["default_collection"]
+    collection.aggregate.return_value = []
+    vector_store = MongoDBAtlasVectorSearch(mongodb_client=client, query_cache_size=1)
+
+    query = VectorStoreQuery(query_embedding=[1.0], similarity_top_k=1)
+    vector_store.query(query)
+    vector_store.query(query)
+    assert collection.aggregate.call_count == 1
+
+    # the least recently used result is evicted
+    vector_store.query(VectorStoreQuery(query_embedding=[2.0], similarity_top_k=1))
+    vector_store.query(query)
+    assert collection.aggregate.call_count == 3
+
+    # deleting nodes drops the cached results
+    vector_store.delete("ref_doc_id")
+    vector_store.query(query)
+    assert collection.aggregate.call_count == 4
+
+
+def test_query_cache_returns_copies():
+    client = MagicMock()
+    collection = client["default_db"]["default_collection"]
+    collection.aggregate.side_effect = lambda *args, **kwargs: [
+        {"id": "node-1", "text": "text", "score": 0.5, "metadata": {}}
+    ]
+    vector_store = MongoDBAtlasVectorSearch(mongodb_client=client, query_cache_size=1)
+
+    query = VectorStoreQuery(query_embedding=[1.0], similarity_top_k=1)
+    node = vector_store.query(query).nodes[0]
+    node.set_content("changed")
+    node.metadata["changed"] = True
+
+    # a caller changing its nodes doesn't change the cached result
+    result = vector_store.query(query)
+    assert collection.aggregate.call_count == 1
+    assert result.nodes[0].get_content() == "text"
+    assert "changed" not in result.nodes[0].metadata
+
+
+def test_to_mongodb_filter():
+    filters = MetadataFilters(
+        filters=[
+            MetadataFilter(key="author", value="Jane"),
+            MetadataFilter(key="year", value=2020, operator=FilterOperator.GTE),
+        ]
+    )
+    assert _to_mongodb_filter(filters) == {"author": "Jane", "year": {"$gte": 2020}}
+
+    filters = MetadataFilters(
+        filters=[
+            MetadataFilter(key="year", value=2020, operator=FilterOperator.GTE),
+            MetadataFilter(key="year", value=2023, operator=FilterOperator.LT),
+        ]
+    )
+    assert _to_mongodb_filter(filters) == {
+        "$and": [{"year": {"$gte": 2020}}, {"year": {"$lt": 2023}}]
+    }
+
+    filters = MetadataFilters(
+        filters=[
+            MetadataFilter(
+                key="author", value=["Jane", "John"], operator=FilterOperator.IN
+            ),
+            MetadataFilter(key="year", value=2020),
+        ],
+        condition=FilterCondition.OR,
+    )
+    assert _to_mongodb_filter(filters) == {
+        "$or": [{"author": {"$in": ["Jane", "John"]}}, {"year": 2020}]
+    }
+
+    # no clauses means no filter, whatever the condition
+    for condition in (FilterCondition.AND, FilterCondition.OR):
+        filters = MetadataFilters(filters=[], condition=condition)
+        assert _to_mongodb_filter(filters) == {}
+    filters = MetadataFilters(
+        filters=[
+            MetadataFilter(key="year", value=2020),
+            MetadataFilters(filters=[], condition=FilterCondition.OR),
+        ]
+    )
+    assert _to_mongodb_filter(filters) == {"year": 2020}
+
+
+def test_aquery():
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(
+        return_value=[{"id": "node-1", "text": "text", "score": 0.5, "metadata": {}}]
+    )
+    async_client = MagicMock()
+    async_client["default_db"]["default_collection"].aggregate.return_value = cursor
+    vector_store = MongoDBAtlasVectorSearch(
+        mongodb_client=MagicMock(), async_mongodb_client=async_client
+    )
+
+    query = VectorStoreQuery(query_embedding=[1.0], similarity_top_k=1)
+    result = asyncio.run(vector_store.aquery(query))
+
+    assert result.ids == ["node-1"]
+    assert result.similarities == [0.5]